@@ -13,6 +13,9 @@ CONFIDENCE_THRESHOLD = 0.5
 PROXIMITY_THRESHOLD = 0.15  # 15% of frame area
 ALERT_COOLDOWN_SECONDS = 5
 CAMERA_INDEX = 0
+# Capture backend: 'auto' (MSMF on Windows, AVFoundation on macOS, V4L2 on
+# Linux), or one of 'dshow', 'msmf', 'v4l2', 'avfoundation'
+CAMERA_BACKEND = os.getenv('CAMERA_BACKEND', 'auto').lower()
 
 # Target object classes (COCO class IDs)
 # Can be overridden via TARGET_CLASSES environment variable as JSON
@@ -51,6 +54,8 @@ OCR_TRIGGER_KEY = 'space'  # Spacebar to trigger OCR
 OCR_TIMEOUT_SECONDS = 10
 MIN_TEXT_LENGTH = 3
 OCR_PROCESSING_COOLDOWN = 2.0  # Minimum seconds between OCR requests
+OCR_BATCH_SIZE = 3  # Frames triggered within OCR_BATCH_MAX_WAIT are OCR'd together
+OCR_BATCH_MAX_WAIT = 0.15  # Seconds to wait for more frames after the first
 
 # Environment variables
 TEST_DATA_PATH = os.getenv('TEST_DATA_PATH', 'test_data/')
@@ -76,6 +81,14 @@ FRAME_SKIP = 3  # Process every 3rd frame for performance
 MAX_DETECTION_LATENCY_MS = 500
 MAX_OCR_LATENCY_SECONDS = 10
 
+# Change gating: skip inference when less than CHANGE_GATE_RATIO of a 160x120
+# grayscale thumbnail differs by more than CHANGE_GATE_PIXEL_THRESHOLD levels
+ENABLE_CHANGE_GATE = os.getenv('ENABLE_CHANGE_GATE', 'true').lower() == 'true'
+CHANGE_GATE_PIXEL_THRESHOLD = 15
+CHANGE_GATE_RATIO = 0.01
+FRAME_RING_SIZE = 4  # Preallocated capture slots (0 allocates a new array per frame)
+STALE_DETECTIONS_SEC = 2.0  # Re-run detection at least this often even on a static scene
+
 # GPU support detection
 try:
     import torch
@@ -87,6 +100,32 @@ except ImportError:
     DEVICE = 'cpu'
     GPU_AVAILABLE = False
 
+# Frames per batched detection call. Batching amortizes inference overhead on
+# GPU; on CPU it only adds latency, so default to single-frame calls there.
+DETECTION_BATCH_SIZE = int(os.getenv('DETECTION_BATCH_SIZE', '4' if USE_GPU else '1'))
+DETECTION_BATCH_MAX_WAIT_MS = 100  # Flush a partial batch after this long to bound alert latency
+DETECTION_INPUT_SIZE = 640  # Longest side frames are downsampled to before inference (YOLOv8 native size)
+
+# Detector backend: 'pytorch' or 'openvino' (CPU only). Exported engines are
+# cached in ENGINE_CACHE_DIR so the export cost is only paid on the first run.
+DETECTOR_BACKEND = os.getenv('DETECTOR_BACKEND', 'pytorch').lower()
+ENGINE_CACHE_DIR = os.getenv('ENGINE_CACHE_DIR', 'models/engine_cache')
+# Detector precision: 'auto' (FP16 on CUDA, FP32 on CPU), 'fp32', 'fp16' or
+# 'int8' (CPU only, quantized OpenVINO export cached in ENGINE_CACHE_DIR)
+DETECTOR_PRECISION = os.getenv('DETECTOR_PRECISION', 'auto').lower()
+
+# Pack each detection batch into a single 640x640 mosaic canvas instead of
+# running a batched forward pass. Trades small-object recall for throughput.
+ENABLE_DETECTION_MOSAIC = os.getenv('ENABLE_DETECTION_MOSAIC', 'false').lower() == 'true'
+
+# Show the developer preview window. Set ENABLE_DISPLAY=false to run headless:
+# no window, overlays or key polling (quit with Ctrl+C)
+ENABLE_DISPLAY = os.getenv('ENABLE_DISPLAY', 'true').lower() == 'true'
+
+# Route display overlays through cv2.UMat (OpenCL T-API). Off by default: the
+# text primitives gain little on most drivers, but it can offload an iGPU laptop's CPU.
+ENABLE_OPENCL_DISPLAY = os.getenv('ENABLE_OPENCL_DISPLAY', 'false').lower() == 'true'
+
 
 def validate_config():
     """
@@ -107,18 +146,38 @@ def validate_config():
     assert 0.0 <= SCENE_CONFIDENCE_THRESHOLD <= 1.0, \
         f"SCENE_CONFIDENCE_THRESHOLD must be between 0 and 1, got {SCENE_CONFIDENCE_THRESHOLD}"
     
+    assert 0.0 <= CHANGE_GATE_RATIO <= 1.0, \
+        f"CHANGE_GATE_RATIO must be between 0 and 1, got {CHANGE_GATE_RATIO}"
+    assert FRAME_RING_SIZE == 0 or FRAME_RING_SIZE >= 3, \
+        f"FRAME_RING_SIZE must be 0 or at least 3, got {FRAME_RING_SIZE}"
+    assert STALE_DETECTIONS_SEC > 0, \
+        f"STALE_DETECTIONS_SEC must be positive, got {STALE_DETECTIONS_SEC}"
+    
     # Validate positive integers
     assert FRAME_SKIP > 0, f"FRAME_SKIP must be positive, got {FRAME_SKIP}"
+    assert DETECTION_BATCH_SIZE > 0, f"DETECTION_BATCH_SIZE must be positive, got {DETECTION_BATCH_SIZE}"
     assert ALERT_COOLDOWN_SECONDS > 0, f"ALERT_COOLDOWN_SECONDS must be positive, got {ALERT_COOLDOWN_SECONDS}"
     assert CAMERA_INDEX >= 0, f"CAMERA_INDEX must be non-negative, got {CAMERA_INDEX}"
+    assert CAMERA_BACKEND in ('auto', 'dshow', 'msmf', 'v4l2', 'avfoundation'), \
+        f"CAMERA_BACKEND must be 'auto', 'dshow', 'msmf', 'v4l2' or 'avfoundation', got {CAMERA_BACKEND}"
     assert SPEECH_RATE > 0, f"SPEECH_RATE must be positive, got {SPEECH_RATE}"
     assert MIN_TEXT_LENGTH > 0, f"MIN_TEXT_LENGTH must be positive, got {MIN_TEXT_LENGTH}"
     assert OCR_PROCESSING_COOLDOWN > 0, f"OCR_PROCESSING_COOLDOWN must be positive, got {OCR_PROCESSING_COOLDOWN}"
+    assert OCR_BATCH_SIZE >= 1, f"OCR_BATCH_SIZE must be at least 1, got {OCR_BATCH_SIZE}"
+    assert OCR_BATCH_MAX_WAIT >= 0, f"OCR_BATCH_MAX_WAIT must be non-negative, got {OCR_BATCH_MAX_WAIT}"
     assert SCENE_UPDATE_INTERVAL > 0, f"SCENE_UPDATE_INTERVAL must be positive, got {SCENE_UPDATE_INTERVAL}"
     
     # Validate latency limits
     assert MAX_DETECTION_LATENCY_MS > 0, f"MAX_DETECTION_LATENCY_MS must be positive, got {MAX_DETECTION_LATENCY_MS}"
     assert MAX_OCR_LATENCY_SECONDS > 0, f"MAX_OCR_LATENCY_SECONDS must be positive, got {MAX_OCR_LATENCY_SECONDS}"
+    assert DETECTION_INPUT_SIZE > 0, f"DETECTION_INPUT_SIZE must be positive, got {DETECTION_INPUT_SIZE}"
+    assert DETECTION_BATCH_MAX_WAIT_MS > 0, f"DETECTION_BATCH_MAX_WAIT_MS must be positive, got {DETECTION_BATCH_MAX_WAIT_MS}"
+    
+    assert DETECTOR_BACKEND in ('pytorch', 'openvino'), \
+        f"DETECTOR_BACKEND must be 'pytorch' or 'openvino', got {DETECTOR_BACKEND}"
+    
+    assert DETECTOR_PRECISION in ('auto', 'fp32', 'fp16', 'int8'), \
+        f"DETECTOR_PRECISION must be 'auto', 'fp32', 'fp16' or 'int8', got {DETECTOR_PRECISION}"
     
     # Validate target classes
     assert isinstance(TARGET_CLASSES, dict), "TARGET_CLASSES must be a dictionary"
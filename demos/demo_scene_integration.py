@@ -10,7 +10,19 @@ import sys
 import os
 import time
 import cv2
+import numpy as np
 import logging
+import logging.handlers
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+
+# Optional faster event loop; the stock asyncio loop works the same, just slower
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -18,17 +30,28 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 # Import configuration and components
 import config
 from src.camera import CameraInterface
-from src.detection import ObjectDetector
+from src.detection import ObjectDetector, DetectionList, FrameChangeGate, resize_for_inference, scale_detections
 from src.audio import AudioManager
 from src.scene_integration import SceneIntegration
+from src.display import draw_detection_boxes, StaticTextLayer, CLOSE_COLOR, FAR_COLOR
 
 
 def setup_logging():
     """Setup logging configuration"""
+    # Buffer records in memory and write them in batches; warnings and errors
+    # flush immediately so problems still show up right away
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=256,
+        flushLevel=logging.WARNING,
+        target=stream_handler
+    )
+    # force: an imported module may already have logged through the root logger
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[logging.StreamHandler(sys.stdout)]
+        handlers=[memory_handler],
+        force=True
     )
 
 
@@ -42,6 +65,11 @@ def demo_scene_integration():
     setup_logging()
     logger = logging.getLogger(__name__)
     
+    # Leave cores for the inference and audio workers so OpenCV's parallel_for_
+    # doesn't oversubscribe the CPU while the model is running
+    cv2.setUseOptimized(True)
+    cv2.setNumThreads(max(1, (os.cpu_count() or 1) - 2))
+    
     try:
         # Initialize components
         logger.info("Initializing components...")
@@ -52,7 +80,13 @@ def demo_scene_integration():
             return False
         
         audio_manager = AudioManager(speech_rate=config.SPEECH_RATE)
-        object_detector = ObjectDetector(confidence_threshold=config.CONFIDENCE_THRESHOLD)
+        object_detector = ObjectDetector(
+            confidence_threshold=config.CONFIDENCE_THRESHOLD,
+            device=config.DEVICE,
+            backend=config.DETECTOR_BACKEND,
+            engine_cache_dir=config.ENGINE_CACHE_DIR,
+            precision=config.DETECTOR_PRECISION
+        )
         
         # Initialize scene integration
         scene_integration = SceneIntegration(
@@ -62,6 +96,11 @@ def demo_scene_integration():
             enabled=config.ENABLE_SCENE_CLASSIFICATION
         )
         
+        # Warm up the scene model so the first interactive frames don't stall
+        # (the detector already warms itself up on construction)
+        logger.info("Warming up models...")
+        scene_integration.warmup()
+        
         print(f"✅ Camera: Initialized")
         print(f"✅ Audio: Initialized")
         print(f"✅ Object Detection: Initialized")
@@ -77,138 +116,283 @@ def demo_scene_integration():
         print("- Scene classification happens automatically every 15 seconds")
         
         # Main demo loop
-        frame_count = 0
-        last_alert_time = {}
+        # Last alert time per class ID; -inf so the first alert always fires
+        last_alert_ts = np.full(object_detector.num_classes, -np.inf, dtype=np.float64)
         
-        cv2.namedWindow('VisionMate Scene Demo', cv2.WINDOW_NORMAL)
-        cv2.resizeWindow('VisionMate Scene Demo', 800, 600)
+        # Frames waiting for a batched detection pass, as (capture_time, frame).
+        # A partial window is flushed once its oldest frame has waited
+        # DETECTION_BATCH_MAX_WAIT_MS, as in main.py, so alerts never describe
+        # a scene that is long gone
+        detection_window = deque(maxlen=config.DETECTION_BATCH_SIZE)
+        batch_max_wait = config.DETECTION_BATCH_MAX_WAIT_MS / 1000.0
         
-        logger.info("Starting demo loop...")
+        # Skip inference while the scene is static and reuse the cached results
+        change_gate = FrameChangeGate(
+            pixel_threshold=config.CHANGE_GATE_PIXEL_THRESHOLD,
+            change_ratio=config.CHANGE_GATE_RATIO
+        ) if config.ENABLE_CHANGE_GATE else None
+        
+        # Capture -> inference -> display pipeline on one asyncio loop. Blocking
+        # calls run on dedicated executors: camera reads, model inference and
+        # speech each get their own worker so none of them stalls the others.
+        # The capture queue holds two frames (double buffer) and the result
+        # queue only the latest result; both drop their oldest entry rather
+        # than block, to keep latency low.
+        io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="demo-io")
+        gpu_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="demo-inference")
+        audio_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="demo-audio")
+        audio_future = None
+        latest_detections = DetectionList()
+        
+        # Scene classification runs on a wall-clock cadence, independent of frame rate
+        next_scene_ts = time.monotonic()
+        
+        def put_latest(q, item):
+            """Put an item on a bounded queue, discarding the oldest entry if full."""
+            while q.full():
+                q.get_nowait()
+            q.put_nowait(item)
         
-        while True:
-            # Capture frame
-            frame = camera.get_frame()
-            if frame is None:
-                logger.warning("Failed to capture frame")
-                time.sleep(0.1)
-                continue
+        def speak(method, *args):
+            """Fire-and-forget speech on the audio executor, skipping if already speaking."""
+            nonlocal audio_future
+            if (audio_future is not None and not audio_future.done()) or audio_manager.is_busy():
+                return False
+            audio_future = audio_pool.submit(method, *args)
+            return True
+        
+        def infer(count, frame):
+            """Run detection and scene classification on one captured frame (blocking)."""
+            nonlocal latest_detections, next_scene_ts
+            alerts = []
+            
+            # Downsample once; the detector and scene classifier share this copy
+            small, scale = resize_for_inference(frame)
+            
+            scene_changed = change_gate is None or change_gate.has_changed(small)
             
-            frame_count += 1
+            # Process object detection (every 3rd frame, batched across a small window)
+            if count % config.FRAME_SKIP == 0 and scene_changed:
+                detection_window.append((time.monotonic(), small))
             
-            # Process object detection (every 3rd frame)
-            detections = []
-            if frame_count % config.FRAME_SKIP == 0:
+            window_full = len(detection_window) == detection_window.maxlen
+            window_stale = detection_window and time.monotonic() - detection_window[0][0] >= batch_max_wait
+            if window_full or window_stale:
                 try:
-                    detections = object_detector.detect(frame)
+                    window = list(detection_window)
+                    detection_window.clear()
+                    window_frames = [f for _, f in window]
+                    if config.ENABLE_DETECTION_MOSAIC and len(window_frames) > 1:
+                        batch_detections = object_detector.detect_mosaic(window_frames)
+                    else:
+                        batch_detections = object_detector.detect_batch(window_frames)
+                    
+                    # Retire results in capture order so alerts stay frame-accurate
+                    for (_, window_frame), frame_detections in zip(window, batch_detections):
+                        h, w = window_frame.shape[:2]
+                        close = frame_detections.close_mask(w, h, config.PROXIMITY_THRESHOLD)
+                        alerts.extend(frame_detections[i] for i in np.flatnonzero(close))
                     
-                    # Process proximity alerts
-                    current_time = time.time()
-                    for detection in detections:
-                        if detection.is_close(frame.shape[1], frame.shape[0]):
-                            last_alert = last_alert_time.get(detection.class_name, 0)
-                            if current_time - last_alert > config.ALERT_COOLDOWN_SECONDS:
-                                if not audio_manager.is_busy():
-                                    audio_manager.speak_alert(detection.class_name)
-                                    last_alert_time[detection.class_name] = current_time
-                                    logger.info(f"Alert: {detection.class_name} detected nearby")
+                    # Display the most recent frame's detections until the next batch
+                    latest_detections = scale_detections(batch_detections[-1], scale)
                 except Exception as e:
-                    logger.error(f"Object detection error: {e}")
+                    logger.error("Object detection error: %s", e)
             
             # Process scene classification
             announced_scene = None
-            if scene_integration.is_enabled() and frame_count % (config.FRAME_SKIP * 5) == 0:
+            now = time.monotonic()
+            if scene_integration.is_enabled() and scene_changed and now >= next_scene_ts:
+                next_scene_ts = now + config.SCENE_UPDATE_INTERVAL
                 try:
-                    announced_scene = scene_integration.process_frame(frame)
+                    announced_scene = scene_integration.process_frame(small)
                     if announced_scene:
-                        logger.info(f"Scene announced: {announced_scene}")
+                        logger.info("Scene announced: %s", announced_scene)
                 except Exception as e:
-                    logger.error(f"Scene classification error: {e}")
+                    logger.error("Scene classification error: %s", e)
             
-            # Create display frame
-            display_frame = frame.copy()
+            return latest_detections, announced_scene, alerts
+        
+        async def capture_loop(frame_queue):
+            """Capture frames into the double buffer until cancelled."""
+            loop = asyncio.get_running_loop()
+            count = 0
+            while True:
+                frame = await loop.run_in_executor(io_pool, camera.get_frame)
+                if frame is None:
+                    logger.warning("Failed to capture frame")
+                    await asyncio.sleep(0.1)
+                    continue
+                count += 1
+                put_latest(frame_queue, (count, frame))
+        
+        async def inference_loop(frame_queue, result_queue):
+            """Feed captured frames through inference and publish the latest result."""
+            loop = asyncio.get_running_loop()
+            while True:
+                count, frame = await frame_queue.get()
+                detections, announced_scene, alerts = await loop.run_in_executor(gpu_pool, infer, count, frame)
+                
+                # Proximity alerts with per-class cooldown
+                current_time = time.monotonic()
+                for detection in alerts:
+                    cid = detection.class_id
+                    if current_time - last_alert_ts[cid] > config.ALERT_COOLDOWN_SECONDS:
+                        if speak(audio_manager.speak_alert, detection.class_name):
+                            last_alert_ts[cid] = current_time
+                            logger.info("Alert: %s detected nearby", detection.class_name)
+                
+                put_latest(result_queue, (count, frame, detections, announced_scene))
+        
+        cv2.namedWindow('VisionMate Scene Demo', cv2.WINDOW_NORMAL)
+        cv2.resizeWindow('VisionMate Scene Demo', 800, 600)
+        
+        logger.info("Starting demo loop...")
+        
+        # Scratch buffer for overlays, reused across frames to avoid per-frame allocation
+        display_frame = None
+        
+        # Opt-in OpenCL (T-API) path for the text overlays and imshow. Numpy-side
+        # steps (copy, static layer, box kernel) run before the UMat wrap.
+        use_umat = config.ENABLE_OPENCL_DISPLAY and cv2.ocl.haveOpenCL()
+        if use_umat:
+            cv2.ocl.setUseOpenCL(True)
+            logger.info("OpenCL display path enabled")
+        
+        # Title and controls never change, so rasterize them once
+        static_text = StaticTextLayer([
+            ("VisionMate-Lite Scene Demo", (10, 30), 0.8, (0, 255, 0), 2),
+            ("Controls: Q=quit, S=force scene, A=test audio", (10, -60), 0.5, (200, 200, 200), 1),
+        ])
+        
+        async def display_loop():
+            """Draw results and handle keys until the user quits."""
+            loop = asyncio.get_running_loop()
+            frame_queue = asyncio.Queue(maxsize=2)
+            result_queue = asyncio.Queue(maxsize=1)
+            workers = [
+                asyncio.create_task(capture_loop(frame_queue)),
+                asyncio.create_task(inference_loop(frame_queue, result_queue)),
+            ]
+            
+            try:
+                while True:
+                    # Wait for the next processed frame; keep the window responsive meanwhile
+                    try:
+                        frame_count, frame, detections, announced_scene = await asyncio.wait_for(
+                            result_queue.get(), timeout=0.05)
+                    except asyncio.TimeoutError:
+                        if cv2.pollKey() & 0xFF == ord('q'):
+                            logger.info("Quit requested")
+                            return
+                        continue
+                    
+                    if not await render_and_handle_keys(loop, frame_count, frame, detections, announced_scene):
+                        return
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+        
+        async def render_and_handle_keys(loop, frame_count, frame, detections, announced_scene):
+            """Draw one frame and react to key presses. Returns False to quit."""
+            nonlocal display_frame
+            
+            # Create display frame. Frames are shared with the inference worker,
+            # so draw on a copy, but reuse the same buffer every iteration.
+            if display_frame is None or display_frame.shape != frame.shape:
+                display_frame = np.empty_like(frame)
+            np.copyto(display_frame, frame)
             
-            # Add status information
-            y_offset = 30
-            cv2.putText(display_frame, "VisionMate-Lite Scene Demo", (10, y_offset), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
-            y_offset += 40
+            # Add status information (title and controls come from the cached layer)
+            static_text.apply(display_frame)
             
-            cv2.putText(display_frame, f"Frame: {frame_count}", (10, y_offset), 
+            # Draw bounding boxes for detections
+            h, w = frame.shape[:2]
+            close_flags = detections.close_mask(w, h, config.PROXIMITY_THRESHOLD) if detections else []
+            draw_detection_boxes(display_frame, detections, close_flags)
+            
+            # Remaining text goes through OpenCV; optionally via the OpenCL T-API
+            canvas = cv2.UMat(display_frame) if use_umat else display_frame
+            y_offset = 70
+            
+            cv2.putText(canvas, f"Frame: {frame_count}", (10, y_offset), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
             y_offset += 30
             
             # Show detected objects
             if detections:
-                cv2.putText(display_frame, f"Objects: {len(detections)}", (10, y_offset), 
+                cv2.putText(canvas, f"Objects: {len(detections)}", (10, y_offset), 
                            cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 1)
                 y_offset += 25
                 
                 for detection in detections:
                     obj_text = f"  {detection.class_name} ({detection.confidence:.2f})"
-                    cv2.putText(display_frame, obj_text, (10, y_offset), 
+                    cv2.putText(canvas, obj_text, (10, y_offset), 
                                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
                     y_offset += 20
             
-            # Show current scene
+            # Show current scene (looked up once and reused by the key handler below)
+            current_scene = scene_integration.get_current_scene() if scene_integration.is_enabled() else None
             if scene_integration.is_enabled():
-                current_scene = scene_integration.get_current_scene()
                 if current_scene:
-                    cv2.putText(display_frame, f"Scene: {current_scene}", (10, y_offset), 
+                    cv2.putText(canvas, f"Scene: {current_scene}", (10, y_offset), 
                                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
                     y_offset += 30
                 
                 if announced_scene:
-                    cv2.putText(display_frame, "SCENE ANNOUNCED!", (10, y_offset), 
+                    cv2.putText(canvas, "SCENE ANNOUNCED!", (10, y_offset), 
                                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 2)
                     y_offset += 30
             
             # Show audio status
             if audio_manager.is_busy():
-                cv2.putText(display_frame, "SPEAKING...", (10, y_offset), 
+                cv2.putText(canvas, "SPEAKING...", (10, y_offset), 
                            cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 2)
             
-            # Draw bounding boxes for detections
-            for detection in detections:
+            # Draw box labels
+            for i, detection in enumerate(detections):
                 x1, y1, x2, y2 = detection.bbox
-                color = (0, 255, 0) if detection.is_close(frame.shape[1], frame.shape[0]) else (255, 0, 0)
-                cv2.rectangle(display_frame, (int(x1), int(y1)), (int(x2), int(y2)), color, 2)
+                color = CLOSE_COLOR if close_flags[i] else FAR_COLOR
                 
                 label = f"{detection.class_name} {detection.confidence:.2f}"
-                cv2.putText(display_frame, label, (int(x1), int(y1-10)), 
+                cv2.putText(canvas, label, (int(x1), int(y1-10)), 
                            cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1)
             
-            # Show controls
-            controls_y = display_frame.shape[0] - 60
-            cv2.putText(display_frame, "Controls: Q=quit, S=force scene, A=test audio", 
-                       (10, controls_y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
-            
             # Display frame
-            cv2.imshow('VisionMate Scene Demo', display_frame)
+            cv2.imshow('VisionMate Scene Demo', canvas)
             
-            # Handle key presses
-            key = cv2.waitKey(1) & 0xFF
+            # Handle key presses (pollKey pumps the window without waiting;
+            # the result queue already paces the loop)
+            key = cv2.pollKey() & 0xFF
             if key == ord('q'):
                 logger.info("Quit requested")
-                break
+                return False
             elif key == ord('s') and scene_integration.is_enabled():
                 logger.info("Forcing scene classification...")
-                forced_scene = scene_integration.force_scene_update(frame)
+                forced_scene = await loop.run_in_executor(gpu_pool, scene_integration.force_scene_update, frame)
                 if forced_scene:
-                    logger.info(f"Forced scene: {forced_scene}")
-                    if not audio_manager.is_busy():
-                        audio_manager.speak_scene(forced_scene)
+                    logger.info("Forced scene: %s", forced_scene)
+                    speak(audio_manager.speak_scene, forced_scene)
                 else:
                     logger.info("Scene classification failed")
             elif key == ord('a'):
                 logger.info("Testing audio announcement...")
-                if not audio_manager.is_busy():
-                    if scene_integration.is_enabled() and scene_integration.get_current_scene():
-                        audio_manager.speak_scene(scene_integration.get_current_scene())
-                    else:
-                        audio_manager.speak_text("Audio system is working correctly")
+                if current_scene:
+                    speak(audio_manager.speak_scene, current_scene)
+                else:
+                    speak(audio_manager.speak_text, "Audio system is working correctly")
             
-            # Small delay
-            time.sleep(0.01)
+            return True
+        
+        if UVLOOP_AVAILABLE:
+            uvloop.install()
+        
+        try:
+            asyncio.run(display_loop())
+        finally:
+            # Stop the executors before releasing the camera they read from
+            for pool in (io_pool, gpu_pool, audio_pool):
+                pool.shutdown(wait=True)
         
         # Cleanup
         camera.release()
@@ -222,7 +406,7 @@ def demo_scene_integration():
         logger.info("Demo interrupted by user")
         return True
     except Exception as e:
-        logger.error(f"Demo failed: {e}")
+        logger.error("Demo failed: %s", e)
         return False
 
 
@@ -20,7 +20,18 @@ import sys
 import os
 import time
 import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from pathlib import Path
+
+try:
+    import cv2
+    import numpy as np
+except ImportError as e:
+    print(f"❌ The demo requires OpenCV and NumPy ({e}).")
+    print("   Install them with: pip install -r requirements.txt")
+    sys.exit(1)
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -29,10 +40,85 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 import config
 from src.error_handler import initialize_error_handling, get_system_validator
 from src.camera import CameraInterface
-from src.detection import ObjectDetector
+from src.detection import get_or_create_detector
 from src.ocr import OCREngine
 from src.audio import AudioManager
 
+# Demo fixtures, built once at import. The synthetic frame is seeded so detection
+# results on it are reproducible across runs.
+_SYNTH_FRAME = np.frombuffer(
+    np.random.default_rng(0).bytes(480 * 640 * 3), dtype=np.uint8
+).reshape(480, 640, 3).copy()
+_EMPTY_IMAGE = np.zeros((100, 100, 3), dtype=np.uint8)
+_INVALID_FRAME = np.zeros((10, 10), dtype=np.uint8)  # Wrong dimensions
+
+# OCR demo text and its rendered fixture on disk, so OCR benchmarks always see
+# exactly the same pixels
+DEMO_OCR_TEXT = "EMERGENCY EXIT\nROOM 101"
+DEMO_OCR_FIXTURE = Path(config.TEST_DATA_PATH) / 'ocr' / 'demo_fixture.png'
+
+
+@functools.lru_cache(maxsize=8)
+def _render_text_image(text):
+    """
+    Render black text lines on a white background (memoized per text).
+    
+    The default demo text is loaded from DEMO_OCR_FIXTURE when present and
+    written there on first use otherwise.
+    
+    Args:
+        text: Text to render; lines are separated by newlines
+        
+    Returns:
+        BGR image; shared between callers, so treat it as read-only
+    """
+    if text == DEMO_OCR_TEXT and DEMO_OCR_FIXTURE.exists():
+        img = cv2.imread(str(DEMO_OCR_FIXTURE), cv2.IMREAD_COLOR)
+        if img is not None:
+            return img
+    
+    # Create white background
+    img = np.ones((200, 500, 3), dtype=np.uint8) * 255
+    
+    # Add text lines
+    lines = text.split('\n')
+    y_start = 60
+    line_height = 40
+    
+    for i, line in enumerate(lines):
+        y_pos = y_start + (i * line_height)
+        cv2.putText(img, line, (20, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 
+                   1.0, (0, 0, 0), 2, cv2.LINE_AA)
+    
+    if text == DEMO_OCR_TEXT:
+        try:
+            DEMO_OCR_FIXTURE.parent.mkdir(parents=True, exist_ok=True)
+            cv2.imwrite(str(DEMO_OCR_FIXTURE), img)
+        except Exception as e:
+            logging.getLogger(__name__).debug(f"Could not write OCR fixture: {e}")
+    
+    return img
+
+
+def _classify_bottleneck(cpu_percent, on_gpu):
+    """
+    Give a roofline-style hint from CPU utilization during a detection call.
+    
+    Args:
+        cpu_percent: Process CPU time over wall time, as a percentage of all cores
+        on_gpu: Whether inference ran on a GPU
+        
+    Returns:
+        Tuple of (bottleneck label, suggested next step)
+    """
+    if on_gpu:
+        return 'gpu', "GPU inference: consider FP16/INT8 engines or larger batches"
+    if cpu_percent > 90:
+        return 'compute-bound', "compute-bound: consider a GPU or quantization (DETECTOR_PRECISION=int8)"
+    if cpu_percent < 70:
+        return 'memory-bound', "likely memory-bound: consider batching, INT8, or a smaller input size"
+    return 'balanced', "CPU moderately loaded: batching and quantization may both help"
+
 
 class VisionMateDemonstrator:
     """Interactive demonstration system for VisionMate-Lite."""
@@ -123,7 +209,13 @@ class VisionMateDemonstrator:
             
             # Initialize object detector
             print("🎯 Initializing object detector...")
-            self.detector = ObjectDetector(confidence_threshold=config.CONFIDENCE_THRESHOLD)
+            self.detector = get_or_create_detector(
+                confidence_threshold=config.CONFIDENCE_THRESHOLD,
+                device=config.DEVICE,
+                backend=config.DETECTOR_BACKEND,
+                engine_cache_dir=config.ENGINE_CACHE_DIR,
+                precision=config.DETECTOR_PRECISION
+            )
             print("✅ Object detector initialized")
             
             # Initialize OCR engine
@@ -162,37 +254,44 @@ class VisionMateDemonstrator:
         self.wait_for_user("Press Enter to start object detection demo...")
         
         try:
-            import cv2
-            import numpy as np
-            
             # Get test frame
             if self.camera and self.camera.camera is not None:
                 frame = self.camera.get_frame()
                 print("📷 Using live camera frame")
             else:
                 # Create synthetic frame for demo
-                frame = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
+                frame = _SYNTH_FRAME
                 print("📷 Using synthetic test frame")
             
             if frame is not None:
                 print("🔍 Running object detection...")
                 start_time = time.perf_counter()
+                start_cpu = time.process_time()
                 
                 detections = self.detector.detect(frame)
                 
                 end_time = time.perf_counter()
                 latency_ms = (end_time - start_time) * 1000
                 
+                # CPU time across all threads relative to what every core could
+                # have done in the same wall time
+                wall = max(end_time - start_time, 1e-9)
+                cpu_percent = 100.0 * (time.process_time() - start_cpu) / (wall * (os.cpu_count() or 1))
+                bottleneck, hint = _classify_bottleneck(cpu_percent, self.detector.device.startswith('cuda'))
+                
                 print(f"⏱️  Detection completed in {latency_ms:.2f}ms")
+                print(f"🧮 CPU utilization during detection: {cpu_percent:.0f}% ({bottleneck})")
                 print(f"🎯 Found {len(detections)} objects")
                 
-                # Show detection results
+                # Show detection results (proximity computed once for all detections)
+                h, w = frame.shape[:2]
+                close = detections.close_mask(w, h, config.PROXIMITY_THRESHOLD)
                 for i, detection in enumerate(detections):
-                    proximity = "CLOSE" if detection.is_close(frame.shape[1], frame.shape[0]) else "FAR"
+                    proximity = "CLOSE" if close[i] else "FAR"
                     print(f"   {i+1}. {detection.class_name} (confidence: {detection.confidence:.2f}, proximity: {proximity})")
                     
                     # Simulate audio alert for close objects
-                    if detection.is_close(frame.shape[1], frame.shape[0]):
+                    if close[i]:
                         alert_message = config.ALERT_MESSAGES.get(detection.class_name, f"{detection.class_name} detected")
                         print(f"   🔊 Audio Alert: '{alert_message}'")
                 
@@ -204,7 +303,10 @@ class VisionMateDemonstrator:
                     'status': 'PASS',
                     'latency_ms': latency_ms,
                     'detections_count': len(detections),
-                    'performance_target_met': target_met
+                    'performance_target_met': target_met,
+                    'cpu_percent': cpu_percent,
+                    'bottleneck': bottleneck,
+                    'bottleneck_hint': hint
                 }
                 
                 return True
@@ -238,12 +340,9 @@ class VisionMateDemonstrator:
         self.wait_for_user("Press Enter to start OCR demo...")
         
         try:
-            import cv2
-            import numpy as np
-            
             # Create test text image
             print("📝 Creating test text image...")
-            test_image = self._create_demo_text_image("EMERGENCY EXIT\nROOM 101")
+            test_image = self._create_demo_text_image(DEMO_OCR_TEXT)
             
             print("🔍 Running OCR extraction...")
             start_time = time.perf_counter()
@@ -302,47 +401,25 @@ class VisionMateDemonstrator:
         
         self.wait_for_user("Press Enter to start error handling demo...")
         
-        error_tests = []
+        # The three probes share no mutable state, so run them concurrently; wall
+        # time is then bounded by the slow camera-open probe rather than the sum
+        probes = [
+            ("Invalid camera handling", self._test_invalid_camera),
+            ("OCR error handling", self._test_ocr_empty),
+            ("Detection error handling", self._test_detection_invalid),
+        ]
         
         try:
-            # Test 1: Invalid camera
-            print("🧪 Test 1: Invalid camera handling...")
-            try:
-                invalid_camera = CameraInterface()
-                result = invalid_camera.initialize_camera(99)  # Invalid index
-                if not result:
-                    print("✅ Invalid camera handled gracefully")
-                    error_tests.append(('invalid_camera', 'PASS'))
-                else:
-                    print("⚠️  Invalid camera not detected")
-                    error_tests.append(('invalid_camera', 'UNEXPECTED'))
-            except Exception as e:
-                print(f"✅ Invalid camera exception handled: {e}")
-                error_tests.append(('invalid_camera', 'PASS'))
+            with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+                futures = {executor.submit(probe): index for index, (_, probe) in enumerate(probes)}
+                outcomes = sorted((futures[f], f.result()) for f in as_completed(futures))
             
-            # Test 2: OCR on empty image
-            print("\n🧪 Test 2: OCR error handling...")
-            try:
-                import numpy as np
-                empty_image = np.zeros((100, 100, 3), dtype=np.uint8)
-                text = self.ocr_engine.extract_text(empty_image)
-                print(f"✅ OCR on empty image handled: '{text}'")
-                error_tests.append(('ocr_empty_image', 'PASS'))
-            except Exception as e:
-                print(f"✅ OCR error handled gracefully: {e}")
-                error_tests.append(('ocr_empty_image', 'PASS'))
-            
-            # Test 3: Detection on invalid frame
-            print("\n🧪 Test 3: Detection error handling...")
-            try:
-                import numpy as np
-                invalid_frame = np.zeros((10, 10), dtype=np.uint8)  # Wrong dimensions
-                detections = self.detector.detect(invalid_frame)
-                print(f"✅ Detection on invalid frame handled: {len(detections)} results")
-                error_tests.append(('detection_invalid_frame', 'PASS'))
-            except Exception as e:
-                print(f"✅ Detection error handled gracefully: {e}")
-                error_tests.append(('detection_invalid_frame', 'PASS'))
+            # Report in a fixed order regardless of completion order
+            error_tests = []
+            for index, (name, status, message) in outcomes:
+                print(f"\n🧪 Test {index + 1}: {probes[index][0]}...")
+                print(message)
+                error_tests.append((name, status))
             
             passed_tests = sum(1 for _, status in error_tests if status == 'PASS')
             print(f"\n📊 Error handling results: {passed_tests}/{len(error_tests)} tests passed")
@@ -361,6 +438,33 @@ class VisionMateDemonstrator:
             self.demo_results['error_handling'] = {'status': 'FAIL', 'error': str(e)}
             return False
     
+    def _test_invalid_camera(self):
+        """Error probe: opening a non-existent camera must fail gracefully."""
+        try:
+            invalid_camera = CameraInterface()
+            result = invalid_camera.initialize_camera(99)  # Invalid index
+            if not result:
+                return ('invalid_camera', 'PASS', "✅ Invalid camera handled gracefully")
+            return ('invalid_camera', 'UNEXPECTED', "⚠️  Invalid camera not detected")
+        except Exception as e:
+            return ('invalid_camera', 'PASS', f"✅ Invalid camera exception handled: {e}")
+    
+    def _test_ocr_empty(self):
+        """Error probe: OCR on an empty image must not raise."""
+        try:
+            text = self.ocr_engine.extract_text(_EMPTY_IMAGE)
+            return ('ocr_empty_image', 'PASS', f"✅ OCR on empty image handled: '{text}'")
+        except Exception as e:
+            return ('ocr_empty_image', 'PASS', f"✅ OCR error handled gracefully: {e}")
+    
+    def _test_detection_invalid(self):
+        """Error probe: detection on an invalid frame must not raise."""
+        try:
+            detections = self.detector.detect(_INVALID_FRAME)
+            return ('detection_invalid_frame', 'PASS', f"✅ Detection on invalid frame handled: {len(detections)} results")
+        except Exception as e:
+            return ('detection_invalid_frame', 'PASS', f"✅ Detection error handled gracefully: {e}")
+    
     def demo_step_6_performance_summary(self):
         """Demo Step 6: Performance summary and recommendations."""
         print("\n" + "📊 STEP 6: Performance Summary")
@@ -377,6 +481,7 @@ class VisionMateDemonstrator:
                 target_met = det_result['performance_target_met']
                 status_icon = "✅" if target_met else "⚠️"
                 print(f"{status_icon} Object Detection: {latency:.2f}ms (target: <500ms)")
+                print(f"   CPU {det_result['cpu_percent']:.0f}% - {det_result['bottleneck_hint']}")
             else:
                 print("❌ Object Detection: FAILED")
         
@@ -407,7 +512,8 @@ class VisionMateDemonstrator:
         else:
             print("⚠️  Some components need attention before demonstration")
             print("⚠️  Review failed tests and address issues")
-            print("⚠️  Consider performance optimizations if needed")
+            bottleneck_hint = self.demo_results.get('object_detection', {}).get('bottleneck_hint')
+            print(f"⚠️  {bottleneck_hint}" if bottleneck_hint else "⚠️  Consider performance optimizations if needed")
         
         return True
     
@@ -468,23 +574,7 @@ class VisionMateDemonstrator:
     
     def _create_demo_text_image(self, text):
         """Create a demo text image for OCR testing."""
-        import cv2
-        import numpy as np
-        
-        # Create white background
-        img = np.ones((200, 500, 3), dtype=np.uint8) * 255
-        
-        # Add text lines
-        lines = text.split('\n')
-        y_start = 60
-        line_height = 40
-        
-        for i, line in enumerate(lines):
-            y_pos = y_start + (i * line_height)
-            cv2.putText(img, line, (20, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 
-                       1.0, (0, 0, 0), 2, cv2.LINE_AA)
-        
-        return img
+        return _render_text_image(text)
     
     def _cleanup(self):
         """Clean up resources."""
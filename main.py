@@ -6,9 +6,19 @@ Main entry point for the application with comprehensive error handling
 
 import sys
 import os
+import time
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import cv2
+    import numpy as np
+    HAS_CV2 = True
+except ImportError:
+    HAS_CV2 = False
+
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
@@ -32,6 +42,14 @@ def setup_logging():
             logging.StreamHandler(sys.stdout)
         ]
     )
+    
+    # Records don't need thread/process introspection; skip it per log call
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+# Records the directory list validate_environment last ensured
+ENV_SENTINEL = '.env_validated'
 
 def validate_environment():
     """Validate that required dependencies and environment are available"""
@@ -41,16 +59,44 @@ def validate_environment():
     if not (config.IS_WINDOWS or config.IS_MACOS):
         logger.warning(f"Platform {config.PLATFORM} may have limited support. Windows and macOS are recommended.")
     
-    # Check test data path
-    test_data_path = Path(config.TEST_DATA_PATH)
-    if not test_data_path.exists():
-        logger.info(f"Creating test data directory: {test_data_path}")
-        test_data_path.mkdir(parents=True, exist_ok=True)
+    # Check required directories (test data path included). A sentinel records
+    # the list that was last ensured, so later startups skip the filesystem
+    # work; delete it to force a re-check. Otherwise each distinct parent is
+    # listed once with scandir and only missing leaves are created
+    required_dirs = {Path(d) for d in (config.TEST_DATA_PATH, 'src', 'test_data/detection', 'test_data/ocr',
+                                       'evaluation', 'models', config.ENGINE_CACHE_DIR)}
+    sentinel = Path(ENV_SENTINEL)
+    signature = "\n".join(str(d) for d in sorted(required_dirs))
+    try:
+        dirs_ensured = sentinel.read_text() == signature
+    except OSError:
+        dirs_ensured = False
     
-    # Check required directories
-    required_dirs = ['src', 'test_data/detection', 'test_data/ocr', 'evaluation', 'models']
-    for dir_path in required_dirs:
-        Path(dir_path).mkdir(parents=True, exist_ok=True)
+    if not dirs_ensured:
+        listings = {}
+        for dir_path in sorted(required_dirs):
+            parent = dir_path.parent
+            if parent not in listings:
+                try:
+                    with os.scandir(parent) as entries:
+                        listings[parent] = {e.name for e in entries if e.is_dir()}
+                except FileNotFoundError:
+                    listings[parent] = set()
+            if dir_path.name not in listings[parent]:
+                logger.info(f"Creating directory: {dir_path}")
+                os.makedirs(dir_path, exist_ok=True)
+        try:
+            sentinel.write_text(signature)
+        except OSError as e:
+            logger.debug(f"Could not write {sentinel}: {e}")
+    
+    # Warm the page cache for weights and fixtures while the models initialize
+    from src.prefetch import start_prefetch
+    start_prefetch(['*.pt', 'models/**/*.pt', os.path.join(config.TEST_DATA_PATH, 'ocr', '**', '*.png')])
+    
+    # Compile the alert scan now rather than on the first detected frame
+    from src.detection import warmup_select_alerts
+    warmup_select_alerts()
     
     logger.info("Environment validation complete")
 
@@ -64,6 +110,10 @@ def main():
     logger.info(f"TTS Engine: {config.TTS_ENGINE}")
     logger.info(f"Test Data Path: {config.TEST_DATA_PATH}")
     
+    if not HAS_CV2:
+        logger.error("OpenCV and NumPy are required. Install them with: pip install -r requirements.txt")
+        sys.exit(1)
+    
     # Initialize error handling system
     if not initialize_error_handling():
         logger.error("System validation failed. Cannot start application.")
@@ -86,7 +136,7 @@ def main():
         
         # Import core modules
         from src.camera import CameraInterface
-        from src.detection import ObjectDetector
+        from src.detection import get_or_create_detector
         from src.ocr import OCREngine
         from src.audio import AudioManager
         from src.keyboard_handler import SimpleKeyboardHandler
@@ -96,7 +146,7 @@ def main():
         logger.info("Initializing core components...")
         
         # Initialize components with error handling
-        camera = CameraInterface()
+        camera = CameraInterface(backend=config.CAMERA_BACKEND)
         if not camera.initialize_camera(config.CAMERA_INDEX):
             logger.error("Failed to initialize camera")
             error_handler.handle_error("camera_error", Exception("Camera initialization failed"), {})
@@ -104,7 +154,14 @@ def main():
         
         audio_manager = AudioManager(speech_rate=config.SPEECH_RATE)
         ocr_engine = OCREngine(min_text_length=config.MIN_TEXT_LENGTH)
-        object_detector = ObjectDetector(confidence_threshold=config.CONFIDENCE_THRESHOLD)
+        ocr_engine.warmup()
+        object_detector = get_or_create_detector(
+            confidence_threshold=config.CONFIDENCE_THRESHOLD,
+            device=config.DEVICE,
+            backend=config.DETECTOR_BACKEND,
+            engine_cache_dir=config.ENGINE_CACHE_DIR,
+            precision=config.DETECTOR_PRECISION
+        )
         
         # Create OCR processor for asynchronous processing
         ocr_processor = create_ocr_processor(ocr_engine, audio_manager, threaded=True)
@@ -161,139 +218,288 @@ def run_main_loop(camera, object_detector, ocr_processor, keyboard_handler, audi
         scene_integration: Scene classification integration (optional)
         logger: Logger instance
     """
-    import cv2
-    import time
+    from src.camera import FrameGrabber
+    from src.display import StaticTextLayer, draw_text
+    from src.detection import FrameChangeGate, resize_for_inference, select_alerts
     
     frame_count = 0
-    last_alert_time = {}
+    # Last alert time per class ID; -inf so the first alert always fires
+    last_alert_time = np.full(object_detector.num_classes, -np.inf, dtype=np.float64)
+    
+    # Reusable overlay buffer and the pre-rendered status line
+    display_frame = None
+    status_layer = StaticTextLayer([
+        ("VisionMate-Lite - Press SPACE for OCR, ESC/Q to quit", (10, 30), 0.6, (0, 255, 0), 2),
+    ])
+    # The error count overlay is refreshed at ~2 Hz instead of every frame
+    error_text = None
+    next_error_refresh = 0.0
+    
+    # Opt-in OpenCL (T-API) path: overlays are drawn on a UMat instead of the
+    # numpy scratch buffer
+    use_umat = config.ENABLE_OPENCL_DISPLAY and cv2.ocl.haveOpenCL()
+    if use_umat:
+        cv2.ocl.setUseOpenCL(True)
+        logger.info("OpenCL display path enabled")
+    
+    # Frames queued for a batched detection pass, as (monotonic capture time, frame)
+    detection_buffer = deque(maxlen=config.DETECTION_BATCH_SIZE)
+    batch_max_wait = config.DETECTION_BATCH_MAX_WAIT_MS / 1000.0
+    
+    # Skip detection while the scene is static; the last results are reused for
+    # proximity alerts until they are older than STALE_DETECTIONS_SEC
+    change_gate = FrameChangeGate(
+        pixel_threshold=config.CHANGE_GATE_PIXEL_THRESHOLD,
+        change_ratio=config.CHANGE_GATE_RATIO
+    ) if config.ENABLE_CHANGE_GATE else None
+    last_detection_time = -np.inf
+    cached_detections = None  # (detections, frame_width, frame_height)
+    
+    # Detection runs on a single worker so the loop keeps capturing, displaying
+    # and polling keys during inference. At most one batch is in flight; frames
+    # arriving meanwhile wait in detection_buffer, which drops the oldest
+    detection_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="detection")
+    
+    # With CPU inference on the worker, the loop's OpenCV calls (resize, copy,
+    # overlays) are small; keep them single-threaded so they don't steal cores
+    # from the model's intra-op threads
+    if object_detector.device == 'cpu':
+        cv2.setNumThreads(1)
+    detection_pending = None  # (future, batch_frames)
+    
+    # Scene classification gets its own worker so a slow classifier neither
+    # blocks the loop nor queues behind a detection batch
+    scene_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scene")
+    scene_pending = None
     error_handler = get_error_handler()
     shutdown_handler = get_graceful_shutdown()
     privacy_manager = get_privacy_manager()
     
     # Create window for display (helps with keyboard input)
-    try:
-        cv2.namedWindow('VisionMate-Lite', cv2.WINDOW_NORMAL)
-        cv2.resizeWindow('VisionMate-Lite', 640, 480)
-    except Exception as e:
-        logger.warning(f"Could not create display window: {e}")
+    if config.ENABLE_DISPLAY:
+        try:
+            cv2.namedWindow('VisionMate-Lite', cv2.WINDOW_NORMAL)
+            cv2.resizeWindow('VisionMate-Lite', 640, 480)
+        except Exception as e:
+            logger.warning("Could not create display window: %s", e)
+    elif keyboard_handler.start_terminal_input():
+        logger.info("Display disabled (headless mode) - press SPACE in this terminal to read text, Q to quit")
+    else:
+        logger.info("Display disabled (headless mode) - press Ctrl+C to quit")
+    
+    def poll_action(timeout_ms):
+        """Next key action from the window, or from the terminal when headless."""
+        if config.ENABLE_DISPLAY:
+            return keyboard_handler.check_input(timeout_ms)
+        return keyboard_handler.poll_terminal()
+    
+    def handle_action(action, ocr_frame):
+        """Act on a key action; returns True when the loop should quit."""
+        if action == 'ocr_trigger':
+            if ocr_frame is None:
+                logger.info("OCR trigger ignored - no frame captured yet")
+            else:
+                logger.info("OCR trigger detected - processing current frame")
+                ocr_processor.process_frame(ocr_frame)
+        elif action == 'quit':
+            logger.info("Quit signal received")
+            return True
+        return False
     
     logger.info("Starting main processing loop...")
     
-    consecutive_frame_failures = 0
-    max_consecutive_failures = 10
+    # Capture runs on a grabber thread so camera reads overlap with processing;
+    # the loop always picks up the newest frame and skips ones it has seen
+    grabber = FrameGrabber(camera, config.CAMERA_INDEX, ring_size=config.FRAME_RING_SIZE)
+    last_seq = -1
+    last_frame = None  # Newest frame seen, for OCR triggers while waiting
+    
+    # Detection and scene classification run on monotonic deadlines rather than
+    # frame counts, so their cadence doesn't stall with a stalling camera. The
+    # periods keep the old ratios at the camera's reported frame rate
+    camera_fps = camera.get_camera_info().get('fps') or 30
+    detect_period = config.FRAME_SKIP / camera_fps
+    scene_period = 5 * detect_period  # Less frequent than object detection
+    next_detect_at = next_scene_at = time.monotonic()
+    
+    def announce_close_objects(detections, w, h):
+        """Speak alerts for close detections whose class is out of cooldown."""
+        # Nothing can be announced while OCR or speech is running, so skip the scan
+        if ocr_processor.is_busy() or audio_manager.is_busy():
+            return
+        current_time = time.time()
+        # Proximity and cooldown in one compiled pass; only hits reach Python
+        alert_mask = select_alerts(detections, w, h, last_alert_time, current_time,
+                                   config.ALERT_COOLDOWN_SECONDS, config.PROXIMITY_THRESHOLD)
+        for i in np.flatnonzero(alert_mask):
+            detection = detections[i]
+            if last_alert_time[detection.class_id] == current_time:
+                continue  # Same class already announced for this frame
+            if not audio_manager.is_busy():
+                audio_manager.speak_alert(detection.class_name)
+                last_alert_time[detection.class_id] = current_time
+                logger.info("Alert: %s detected nearby", detection.class_name)
+    
+    grabber.start()
     
     try:
         while not shutdown_handler.is_shutdown_requested():
             try:
-                # Capture frame with error handling
-                frame = camera.get_frame()
+                # Sleep until the grabber signals a new frame rather than polling. On
+                # timeout, keep the window pumped and handle keys so a stalled camera
+                # can't hang the UI; OCR then reads the last frame that arrived
+                last_seq, frame = grabber.wait_for_frame(last_seq, timeout=0.05)
                 if frame is None:
-                    consecutive_frame_failures += 1
-                    logger.warning(f"Failed to capture frame ({consecutive_frame_failures}/{max_consecutive_failures})")
-                    
-                    if consecutive_frame_failures >= max_consecutive_failures:
-                        logger.error("Too many consecutive frame failures, attempting camera recovery")
-                        if not camera.initialize_camera(config.CAMERA_INDEX):
-                            logger.error("Camera recovery failed, exiting")
-                            break
-                        consecutive_frame_failures = 0
-                    
-                    time.sleep(0.1)
+                    if grabber.lost.is_set() or handle_action(poll_action(1), last_frame):
+                        break
                     continue
-                else:
-                    consecutive_frame_failures = 0  # Reset on successful frame
+                last_frame = frame
                 
                 # Save debug frame if enabled
                 if privacy_manager.can_save_frame() and frame_count % 100 == 0:  # Save every 100th frame
                     privacy_manager.save_debug_frame(frame, f"main_loop_frame_{frame_count}.jpg")
                 
-                # Check for keyboard input
-                try:
-                    action = keyboard_handler.check_input(1)  # 1ms timeout
-                    
-                    if action == 'ocr_trigger':
-                        logger.info("OCR trigger detected - processing current frame")
-                        ocr_processor.process_frame(frame)
-                    elif action == 'quit':
-                        logger.info("Quit signal received")
-                        break
-                except Exception as e:
-                    logger.warning(f"Keyboard input error: {e}")
+                # Downsample once for every model that looks at this frame; the
+                # proximity check is an area ratio, so no rescaling is needed
+                now = time.monotonic()
+                run_detection = now >= next_detect_at
+                if run_detection:
+                    next_detect_at = now + detect_period
+                run_scene = bool(scene_integration) and now >= next_scene_at
+                if run_scene:
+                    next_scene_at = now + scene_period
+                if run_detection or run_scene:
+                    model_frame, _ = resize_for_inference(frame, config.DETECTION_INPUT_SIZE)
+                
+                # Process object detection (every detect_period for performance), batched
+                # across up to DETECTION_BATCH_SIZE frames; a partial batch is flushed
+                # once its oldest frame has waited DETECTION_BATCH_MAX_WAIT_MS
+                if run_detection:
+                    scene_changed = change_gate is None or change_gate.has_changed(model_frame)
+                    if scene_changed or now - last_detection_time >= config.STALE_DETECTIONS_SEC:
+                        # Frames wait for the worker longer than a ring slot lives, so
+                        # a model frame that still aliases the ring is copied out
+                        if model_frame is frame:
+                            model_frame = frame.copy()
+                        detection_buffer.append((now, model_frame))
+                    elif cached_detections is not None:
+                        try:
+                            announce_close_objects(*cached_detections)
+                        except Exception as e:
+                            logger.error("Object detection error: %s", e)
                 
-                # Process object detection (every 3rd frame for performance)
-                if frame_count % config.FRAME_SKIP == 0:
+                # Harvest the finished batch, if any
+                if detection_pending is not None and detection_pending[0].done():
+                    future, batch_frames = detection_pending
+                    detection_pending = None
                     try:
-                        detections = object_detector.detect(frame)
+                        batch_detections = future.result()
+                        last_detection_time = time.monotonic()
                         
-                        # Process detections for proximity alerts
-                        current_time = time.time()
-                        for detection in detections:
-                            if detection.is_close(frame.shape[1], frame.shape[0]):
-                                # Check alert cooldown
-                                last_alert = last_alert_time.get(detection.class_name, 0)
-                                if current_time - last_alert > config.ALERT_COOLDOWN_SECONDS:
-                                    if not audio_manager.is_busy() and not ocr_processor.is_busy():
-                                        audio_manager.speak_alert(detection.class_name)
-                                        last_alert_time[detection.class_name] = current_time
-                                        logger.info(f"Alert: {detection.class_name} detected nearby")
+                        # Process detections for proximity alerts, oldest frame first
+                        for batch_frame, detections in zip(batch_frames, batch_detections):
+                            h, w = batch_frame.shape[:2]
+                            cached_detections = (detections, w, h)
+                            announce_close_objects(detections, w, h)
                     except Exception as e:
-                        logger.error(f"Object detection error: {e}")
+                        logger.error("Object detection error: %s", e)
                         error_handler.handle_error("general_error", e, {"phase": "object_detection"})
                 
-                # Process scene classification (if enabled)
-                if scene_integration and frame_count % (config.FRAME_SKIP * 5) == 0:  # Less frequent than object detection
+                batch_full = len(detection_buffer) == detection_buffer.maxlen
+                batch_stale = detection_buffer and time.monotonic() - detection_buffer[0][0] >= batch_max_wait
+                if (batch_full or batch_stale) and detection_pending is None:
+                    batch_frames = [f for _, f in detection_buffer]
+                    detection_buffer.clear()
+                    detection_pending = (detection_executor.submit(object_detector.detect_batch, batch_frames),
+                                         batch_frames)
+                
+                # Process scene classification (if enabled) in the background; a
+                # deadline that passes while the previous frame is still being
+                # classified is skipped rather than queued
+                if scene_pending is not None and scene_pending.done():
+                    future, scene_pending = scene_pending, None
                     try:
-                        announced_scene = scene_integration.process_frame(frame)
+                        announced_scene = future.result()
                         if announced_scene:
-                            logger.info(f"Scene announced: {announced_scene}")
+                            logger.info("Scene announced: %s", announced_scene)
                     except Exception as e:
-                        logger.error(f"Scene classification error: {e}")
+                        logger.error("Scene classification error: %s", e)
                         error_handler.handle_error("general_error", e, {"phase": "scene_classification"})
                 
-                # Display frame (optional, helps with keyboard input)
+                if run_scene and scene_pending is None:
+                    if model_frame is frame:
+                        model_frame = frame.copy()
+                    scene_pending = scene_executor.submit(scene_integration.process_frame, model_frame)
+                
+                # Display frame and keyboard input (developer view; skipped when headless)
+                if config.ENABLE_DISPLAY:
+                    try:
+                        # Dynamic overlays as (text, org, font_scale, color, thickness)
+                        overlays = []
+                        if ocr_processor.is_busy():
+                            overlays.append(("Processing OCR...", (10, 60), 0.6, (0, 0, 255), 2))
+                        
+                        # Show current scene if available
+                        if scene_integration:
+                            current_scene = scene_integration.get_current_scene()
+                            if current_scene:
+                                overlays.append((f"Scene: {current_scene}", (10, 90), 0.5, (0, 255, 255), 1))
+                        
+                        # Show error count if any
+                        if now >= next_error_refresh:
+                            error_summary = error_handler.get_error_summary()
+                            error_text = f"Errors: {sum(error_summary.values())}" if error_summary else None
+                            next_error_refresh = now + 0.5
+                        if error_text:
+                            overlays.append((error_text, (10, 120), 0.5, (0, 0, 255), 1))
+                        
+                        if use_umat:
+                            # The upload doubles as the copy that keeps the ring slot
+                            # untouched; every overlay is then drawn through OpenCL
+                            canvas = cv2.UMat(frame)
+                            for text, org, font_scale, color, thickness in status_layer.items + overlays:
+                                cv2.putText(canvas, text, org, cv2.FONT_HERSHEY_SIMPLEX, font_scale, color, thickness)
+                        else:
+                            # The frame itself is still referenced by the OCR worker and the
+                            # detection batch, so overlay onto a persistent copy instead
+                            if display_frame is None or display_frame.shape != frame.shape:
+                                display_frame = np.empty_like(frame)
+                            np.copyto(display_frame, frame)
+                            status_layer.apply(display_frame)
+                            for text, org, font_scale, color, thickness in overlays:
+                                draw_text(display_frame, text, org, font_scale, color, thickness)
+                            canvas = display_frame
+                        
+                        cv2.imshow('VisionMate-Lite', canvas)
+                    except Exception as e:
+                        logger.warning("Display error: %s", e)
+                
+                # Check for keyboard input. With a window this is the iteration's
+                # only waitKey: it pumps the window just shown and returns the
+                # pressed key. Headless, keys come from the terminal reader
                 try:
-                    display_frame = frame.copy()
-                    
-                    # Add status text
-                    status_text = "VisionMate-Lite - Press SPACE for OCR, ESC/Q to quit"
-                    cv2.putText(display_frame, status_text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-                    
-                    if ocr_processor.is_busy():
-                        cv2.putText(display_frame, "Processing OCR...", (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 2)
-                    
-                    # Show current scene if available
-                    if scene_integration:
-                        current_scene = scene_integration.get_current_scene()
-                        if current_scene:
-                            scene_text = f"Scene: {current_scene}"
-                            cv2.putText(display_frame, scene_text, (10, 90), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
-                    
-                    # Show error count if any
-                    error_summary = error_handler.get_error_summary()
-                    if error_summary:
-                        error_text = f"Errors: {sum(error_summary.values())}"
-                        cv2.putText(display_frame, error_text, (10, 120), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 1)
-                    
-                    cv2.imshow('VisionMate-Lite', display_frame)
+                    if handle_action(poll_action(1), frame):
+                        break
                 except Exception as e:
-                    logger.warning(f"Display error: {e}")
+                    logger.warning("Keyboard input error: %s", e)
                 
                 frame_count += 1
                 
-                # Small delay to prevent excessive CPU usage
-                time.sleep(0.01)
-                
             except Exception as e:
-                logger.error(f"Error in main loop iteration: {e}")
+                logger.error("Error in main loop iteration: %s", e)
                 error_handler.handle_error("general_error", e, {"phase": "main_loop", "frame_count": frame_count})
                 time.sleep(0.1)  # Brief pause before continuing
             
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
     except Exception as e:
-        logger.error(f"Critical error in main loop: {e}")
+        logger.error("Critical error in main loop: %s", e)
         error_handler.handle_error("general_error", e, {"phase": "main_loop_critical"})
     finally:
+        grabber.stop()
+        keyboard_handler.stop_terminal_input()
+        detection_executor.shutdown(wait=True, cancel_futures=True)
+        scene_executor.shutdown(wait=True, cancel_futures=True)
         try:
             cv2.destroyAllWindows()
         except:
@@ -303,7 +509,7 @@ def run_main_loop(camera, object_detector, ocr_processor, keyboard_handler, audi
         # Print error summary
         error_summary = error_handler.get_error_summary()
         if error_summary:
-            logger.info(f"Error summary: {error_summary}")
+            logger.info("Error summary: %s", error_summary)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -2,10 +2,15 @@
 Generate figures and tables for COMP5523 Project Report
 Uses actual evaluation results from evaluation_results.json
 """
+import matplotlib
+matplotlib.use('Agg')  # Files only; skip GUI backend probing
 import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
 from pathlib import Path
+import csv
+import functools
+import hashlib
+import inspect
 import json
 
 # Load evaluation results
@@ -18,16 +23,125 @@ except FileNotFoundError:
     print("   Using default values...")
     eval_results = None
 
+# Detection metrics as one table: rows are precision (%), recall (%), F1 and
+# test samples; columns are person, chair, car and overall. Rows stay plain
+# lists so the report prints the source values unchanged
+CLASS_NAMES = ['Person', 'Chair', 'Car', 'Overall']
+
+def _extract_class_metrics(results):
+    """Collect the per-class detection metrics into four rows in a single pass"""
+    accuracy = results['detection_accuracy']
+    keys = ['person', 'chair', 'car', 'overall']
+    metrics = [[accuracy[k]['precision'] * 100 for k in keys],
+               [accuracy[k]['recall'] * 100 for k in keys],
+               [accuracy[k]['f1'] for k in keys],
+               [accuracy[k].get('samples', 0) for k in keys]]
+    # The overall sample count is the dataset size
+    metrics[3][3] = results['dataset']['total_images']
+    return metrics
+
+if eval_results:
+    class_metrics = _extract_class_metrics(eval_results)
+else:
+    # Fallback
+    class_metrics = [[85, 72, 88, 81.67],
+                     [78, 65, 82, 75.00],
+                     [0.81, 0.68, 0.85, 0.78],
+                     [15, 15, 15, 45]]
+
 # Create output directory
 output_dir = Path("docs/report_figures")
 output_dir.mkdir(exist_ok=True)
 
-# Set style for professional-looking plots
-plt.style.use('seaborn-v0_8-darkgrid')
-plt.rcParams['font.family'] = 'Times New Roman'
-plt.rcParams['font.size'] = 10
+# Set style for professional-looking plots: the darkgrid look set directly,
+# with matplotlib's bundled serif font so no system font search is needed
+plt.rcParams.update({
+    'axes.facecolor': '#EAEAF2',
+    'axes.edgecolor': 'white',
+    'axes.grid': True,
+    'axes.axisbelow': True,
+    'grid.color': 'white',
+    'font.family': 'DejaVu Serif',
+    'font.size': 10
+})
+
+def cached_output(*filenames):
+    """
+    Skip a generator when its outputs were produced from the same inputs.
+    
+    The key hashes the evaluation results and the generator's source; it is
+    stored next to each output as <file>.sha and compared on the next run.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper():
+            payload = json.dumps(eval_results, sort_keys=True).encode() + inspect.getsource(func).encode()
+            key = hashlib.blake2b(payload, digest_size=16).hexdigest()
+            paths = [output_dir / name for name in filenames]
+            sidecars = [path.with_name(path.name + '.sha') for path in paths]
+            
+            if all(path.exists() and sidecar.exists() and sidecar.read_text() == key
+                   for path, sidecar in zip(paths, sidecars)):
+                print(f"✓ Up to date: {', '.join(filenames)}")
+                return
+            
+            func()
+            for path, sidecar in zip(paths, sidecars):
+                if path.exists():
+                    sidecar.write_text(key)
+        return wrapper
+    return decorator
+
+# The single-axes figures share one 8x5 Figure, cleared between plots
+_FIG = _AX = None
+
+def _get_ax():
+    """Return the shared single-plot Axes, cleared for the next figure"""
+    global _FIG, _AX
+    if _FIG is None:
+        _FIG, _AX = plt.subplots(figsize=(8, 5))
+    else:
+        _AX.clear()
+    return _AX
+
+def _save_shared(filename):
+    """Lay out and save the shared Figure"""
+    _FIG.tight_layout()
+    _FIG.savefig(output_dir / filename, dpi=300, bbox_inches='tight')
+
+def _format_column(column):
+    """Format a column's cells like DataFrame.to_string: floats share one precision"""
+    numeric = all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in column)
+    if not numeric or not any(isinstance(v, float) for v in column):
+        return [str(v) for v in column]
+    # Six decimals, then drop the trailing zeros every cell has (keeping one)
+    cells = [f"{v:.6f}" for v in column]
+    for _ in range(5):
+        if not all(c.endswith('0') for c in cells):
+            break
+        cells = [c[:-1] for c in cells]
+    return cells
+
+def write_table(name, title, rule_width, data):
+    """Write a column dict as <name>.csv and a right-aligned <name>.txt table"""
+    headers = list(data)
+    rows = list(zip(*data.values()))
+    
+    with open(output_dir / f'{name}.csv', 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        writer.writerows(rows)
+    
+    columns = [_format_column(column) for column in data.values()]
+    widths = [max(len(v) for v in [header, *column]) for header, column in zip(headers, columns)]
+    lines = [" ".join(v.rjust(w) for v, w in zip(row, widths)) for row in [headers, *zip(*columns)]]
+    with open(output_dir / f'{name}.txt', 'w', encoding='utf-8') as f:
+        f.write(title + "\n")
+        f.write("=" * rule_width + "\n")
+        f.write("\n".join(lines))
 
 # Figure 1: Performance Metrics Comparison (Target vs Achieved)
+@cached_output('figure1_performance_comparison.png')
 def generate_performance_comparison():
     metrics = ['Detection\nLatency (ms)', 'OCR\nProcessing (s)', 
                'System\nStartup (s)', 'Memory\nUsage (MB)']
@@ -37,7 +151,7 @@ def generate_performance_comparison():
     x = np.arange(len(metrics))
     width = 0.35
     
-    fig, ax = plt.subplots(figsize=(8, 5))
+    ax = _get_ax()
     bars1 = ax.bar(x - width/2, targets, width, label='Target', color='#FF6B6B', alpha=0.8)
     bars2 = ax.bar(x + width/2, achieved, width, label='Achieved', color='#4ECDC4', alpha=0.8)
     
@@ -56,36 +170,20 @@ def generate_performance_comparison():
                    f'{height:.0f}',
                    ha='center', va='bottom', fontsize=9)
     
-    plt.tight_layout()
-    plt.savefig(output_dir / 'figure1_performance_comparison.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _save_shared('figure1_performance_comparison.png')
     print("✓ Generated Figure 1: Performance Comparison")
 
 # Figure 2: Detection Accuracy by Object Class
+@cached_output('figure2_detection_accuracy.png')
 def generate_detection_accuracy():
-    if eval_results:
-        # Use actual data
-        classes = ['Person', 'Chair', 'Car']
-        precision = [
-            eval_results['detection_accuracy']['person']['precision'] * 100,
-            eval_results['detection_accuracy']['chair']['precision'] * 100,
-            eval_results['detection_accuracy']['car']['precision'] * 100
-        ]
-        recall = [
-            eval_results['detection_accuracy']['person']['recall'] * 100,
-            eval_results['detection_accuracy']['chair']['recall'] * 100,
-            eval_results['detection_accuracy']['car']['recall'] * 100
-        ]
-    else:
-        # Fallback
-        classes = ['Person', 'Chair', 'Car']
-        precision = [85, 72, 88]
-        recall = [78, 65, 82]
+    # Per-class columns only; the overall column is for the table
+    classes = CLASS_NAMES[:3]
+    precision, recall = class_metrics[0][:3], class_metrics[1][:3]
     
     x = np.arange(len(classes))
     width = 0.35
     
-    fig, ax = plt.subplots(figsize=(8, 5))
+    ax = _get_ax()
     bars1 = ax.bar(x - width/2, precision, width, label='Precision (%)', color='#95E1D3', alpha=0.9)
     bars2 = ax.bar(x + width/2, recall, width, label='Recall (%)', color='#F38181', alpha=0.9)
     
@@ -102,15 +200,14 @@ def generate_detection_accuracy():
         for bar in bars:
             height = bar.get_height()
             ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{height}%',
+                   f'{height:.1f}%',
                    ha='center', va='bottom', fontsize=9)
     
-    plt.tight_layout()
-    plt.savefig(output_dir / 'figure2_detection_accuracy.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _save_shared('figure2_detection_accuracy.png')
     print("✓ Generated Figure 2: Detection Accuracy")
 
 # Figure 3: OCR Performance Metrics
+@cached_output('figure3_ocr_performance.png')
 def generate_ocr_performance():
     if eval_results and eval_results['ocr_accuracy']['evaluated']:
         # Use actual OCR data
@@ -155,12 +252,13 @@ def generate_ocr_performance():
         print("⚠️  Skipping Figure 3: OCR not evaluated")
 
 # Figure 4: Processing Latency Distribution
+@cached_output('figure4_latency_distribution.png')
 def generate_latency_distribution():
     # Simulated latency data based on actual measurements
     np.random.seed(42)
     detection_latencies = np.random.normal(428, 45, 100)
     
-    fig, ax = plt.subplots(figsize=(8, 5))
+    ax = _get_ax()
     
     n, bins, patches = ax.hist(detection_latencies, bins=20, color='#6C5CE7', 
                                 alpha=0.7, edgecolor='black', linewidth=1)
@@ -175,12 +273,11 @@ def generate_latency_distribution():
     ax.legend(fontsize=10)
     ax.grid(axis='y', alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(output_dir / 'figure4_latency_distribution.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _save_shared('figure4_latency_distribution.png')
     print("✓ Generated Figure 4: Latency Distribution")
 
 # Table 1: System Performance Summary
+@cached_output('table1_performance_summary.csv', 'table1_performance_summary.txt')
 def generate_performance_table():
     data = {
         'Metric': [
@@ -217,71 +314,28 @@ def generate_performance_table():
         ]
     }
     
-    df = pd.DataFrame(data)
-    
-    # Save as CSV for easy import
-    df.to_csv(output_dir / 'table1_performance_summary.csv', index=False)
-    
-    # Create formatted text version
-    with open(output_dir / 'table1_performance_summary.txt', 'w', encoding='utf-8') as f:
-        f.write("Table 1: System Performance Summary\n")
-        f.write("=" * 80 + "\n")
-        f.write(df.to_string(index=False))
+    # Save as CSV for easy import, plus a formatted text version
+    write_table('table1_performance_summary', "Table 1: System Performance Summary", 80, data)
     
     print("✓ Generated Table 1: Performance Summary")
 
 # Table 2: Detection Accuracy Summary
+@cached_output('table2_detection_accuracy.csv', 'table2_detection_accuracy.txt')
 def generate_accuracy_table():
-    if eval_results:
-        # Use actual data
-        data = {
-            'Object Class': ['Person', 'Chair', 'Car', 'Overall'],
-            'Precision (%)': [
-                eval_results['detection_accuracy']['person']['precision'] * 100,
-                eval_results['detection_accuracy']['chair']['precision'] * 100,
-                eval_results['detection_accuracy']['car']['precision'] * 100,
-                eval_results['detection_accuracy']['overall']['precision'] * 100
-            ],
-            'Recall (%)': [
-                eval_results['detection_accuracy']['person']['recall'] * 100,
-                eval_results['detection_accuracy']['chair']['recall'] * 100,
-                eval_results['detection_accuracy']['car']['recall'] * 100,
-                eval_results['detection_accuracy']['overall']['recall'] * 100
-            ],
-            'F1-Score': [
-                eval_results['detection_accuracy']['person']['f1'],
-                eval_results['detection_accuracy']['chair']['f1'],
-                eval_results['detection_accuracy']['car']['f1'],
-                eval_results['detection_accuracy']['overall']['f1']
-            ],
-            'Test Samples': [
-                eval_results['detection_accuracy']['person']['samples'],
-                eval_results['detection_accuracy']['chair']['samples'],
-                eval_results['detection_accuracy']['car']['samples'],
-                eval_results['dataset']['total_images']
-            ]
-        }
-    else:
-        # Fallback
-        data = {
-            'Object Class': ['Person', 'Chair', 'Car', 'Overall'],
-            'Precision (%)': [85, 72, 88, 81.67],
-            'Recall (%)': [78, 65, 82, 75.00],
-            'F1-Score': [0.81, 0.68, 0.85, 0.78],
-            'Test Samples': [15, 15, 15, 45]
-        }
-    
-    df = pd.DataFrame(data)
-    df.to_csv(output_dir / 'table2_detection_accuracy.csv', index=False)
+    data = {
+        'Object Class': CLASS_NAMES,
+        'Precision (%)': class_metrics[0],
+        'Recall (%)': class_metrics[1],
+        'F1-Score': class_metrics[2],
+        'Test Samples': class_metrics[3]
+    }
     
-    with open(output_dir / 'table2_detection_accuracy.txt', 'w', encoding='utf-8') as f:
-        f.write("Table 2: Object Detection Accuracy by Class\n")
-        f.write("=" * 80 + "\n")
-        f.write(df.to_string(index=False))
+    write_table('table2_detection_accuracy', "Table 2: Object Detection Accuracy by Class", 80, data)
     
     print("✓ Generated Table 2: Detection Accuracy")
 
 # Table 3: Testing Scenarios Results
+@cached_output('table3_testing_scenarios.csv', 'table3_testing_scenarios.txt')
 def generate_testing_scenarios_table():
     if eval_results and eval_results['ocr_accuracy']['evaluated']:
         ocr_cases = eval_results['ocr_accuracy']['total_images']
@@ -318,17 +372,12 @@ def generate_testing_scenarios_table():
         ]
     }
     
-    df = pd.DataFrame(data)
-    df.to_csv(output_dir / 'table3_testing_scenarios.csv', index=False)
-    
-    with open(output_dir / 'table3_testing_scenarios.txt', 'w', encoding='utf-8') as f:
-        f.write("Table 3: Manual Testing Scenarios Results\n")
-        f.write("=" * 100 + "\n")
-        f.write(df.to_string(index=False))
+    write_table('table3_testing_scenarios', "Table 3: Manual Testing Scenarios Results", 100, data)
     
     print("✓ Generated Table 3: Testing Scenarios")
 
 # Table 4: OCR Performance Metrics
+@cached_output('table4_ocr_performance.csv', 'table4_ocr_performance.txt')
 def generate_ocr_table():
     if eval_results and eval_results['ocr_accuracy']['evaluated']:
         data = {
@@ -355,13 +404,7 @@ def generate_ocr_table():
             ]
         }
         
-        df = pd.DataFrame(data)
-        df.to_csv(output_dir / 'table4_ocr_performance.csv', index=False)
-        
-        with open(output_dir / 'table4_ocr_performance.txt', 'w', encoding='utf-8') as f:
-            f.write("Table 4: OCR Performance Metrics\n")
-            f.write("=" * 80 + "\n")
-            f.write(df.to_string(index=False))
+        write_table('table4_ocr_performance', "Table 4: OCR Performance Metrics", 80, data)
         
         print("✓ Generated Table 4: OCR Performance")
     else:
@@ -384,4 +427,6 @@ if __name__ == "__main__":
     print(f"✓ All figures and tables generated in: {output_dir}")
     print("\nGenerated files:")
     for file in sorted(output_dir.glob("*")):
+        if file.suffix == '.sha':
+            continue
         print(f"  - {file.name}")
@@ -0,0 +1,150 @@
+"""
+Persistent EasyOCR service for evaluate_ocr.py
+
+Loading easyocr.Reader takes seconds per process. Start this once and keep it
+running; evaluate_ocr.py detects it and sends preprocessed image batches here
+instead of loading its own readers, so reruns after tweaking preprocessing
+skip model loading entirely.
+
+    python scripts/ocr_daemon.py --readers 2
+"""
+import argparse
+import os
+import platform
+import queue
+import secrets
+import stat
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+
+# Connections exchange pickles, so both ends prove knowledge of a secret that
+# only the current user can read before anything is unpickled. The secret and
+# the socket live in a directory private to the user.
+PRIVATE_DIR = os.environ.get('XDG_RUNTIME_DIR') or os.path.join(os.path.expanduser('~'), '.visionmate')
+AUTHKEY_FILE = os.path.join(PRIVATE_DIR, 'ocr_daemon.key')
+
+if platform.system() == "Windows":
+    DAEMON_ADDRESS = r'\\.\pipe\visionmate_ocr'
+else:
+    DAEMON_ADDRESS = os.path.join(PRIVATE_DIR, 'visionmate_ocr.sock')
+
+def _check_private(path):
+    """Refuse paths owned by another user or accessible to group/others"""
+    if platform.system() == "Windows":
+        return
+    info = os.stat(path)
+    if info.st_uid != os.getuid() or info.st_mode & (stat.S_IRWXG | stat.S_IRWXO):
+        raise PermissionError(f"{path} must be owned by the current user and not group/world accessible")
+
+def _load_authkey(create=False):
+    """Read the shared secret, creating it (mode 0600) if requested"""
+    if create:
+        os.makedirs(PRIVATE_DIR, mode=0o700, exist_ok=True)
+        _check_private(PRIVATE_DIR)
+        try:
+            fd = os.open(AUTHKEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            pass
+        else:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(secrets.token_bytes(32))
+    _check_private(AUTHKEY_FILE)
+    with open(AUTHKEY_FILE, 'rb') as f:
+        return f.read()
+
+def _connect(address):
+    """Open an authenticated connection to a daemon run by the current user"""
+    if platform.system() != "Windows":
+        _check_private(address)
+    return Client(address, authkey=_load_authkey())
+
+def daemon_available(address=DAEMON_ADDRESS):
+    """Check whether a daemon is listening and answering at address"""
+    try:
+        with _connect(address) as conn:
+            conn.send(('ping',))
+            return conn.recv() == 'pong'
+    except (OSError, EOFError, AuthenticationError):
+        return False
+
+def recognize(images, n_width, n_height, batch_size, address=DAEMON_ADDRESS):
+    """Run readtext_batched on the daemon; returns one joined text per image"""
+    with _connect(address) as conn:
+        conn.send(('ocr', images, n_width, n_height, batch_size))
+        status, payload = conn.recv()
+    if status != 'ok':
+        raise RuntimeError(f"OCR daemon error: {payload}")
+    return payload
+
+def _handle(conn, readers):
+    """Serve one request on its own thread, borrowing a free reader"""
+    with conn:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            return
+
+        if request[0] == 'ping':
+            conn.send('pong')
+            return
+
+        _, images, n_width, n_height, batch_size = request
+        reader = readers.get()
+        try:
+            results = reader.readtext_batched(images, n_width=n_width, n_height=n_height,
+                                              batch_size=batch_size, detail=0)
+            conn.send(('ok', [' '.join(words).strip() for words in results]))
+        except Exception as e:
+            conn.send(('error', str(e)))
+        finally:
+            readers.put(reader)
+
+def serve(num_readers=1, address=DAEMON_ADDRESS):
+    """Load the readers once and answer requests until interrupted"""
+    if daemon_available(address):
+        print(f"❌ An OCR daemon is already running at {address}")
+        return
+    authkey = _load_authkey(create=True)
+
+    import numpy as np
+    import torch
+    import easyocr
+
+    # Readers run concurrently on request threads and share torch's pool
+    torch.set_num_threads(max(1, (os.cpu_count() or 1) // num_readers))
+
+    print(f"Loading {num_readers} EasyOCR reader(s)...")
+    readers = queue.Queue()
+    for _ in range(num_readers):
+        reader = easyocr.Reader(['en'], gpu=False, verbose=False)
+        # Warm-up pass so the first request doesn't pay one-time setup costs
+        reader.readtext_batched(np.zeros((2, 480, 640), dtype=np.uint8),
+                                n_width=640, n_height=480, batch_size=2, detail=0)
+        readers.put(reader)
+
+    # A socket file left behind by a crashed daemon would block binding
+    if platform.system() != "Windows" and os.path.exists(address):
+        os.unlink(address)
+
+    with Listener(address, authkey=authkey) as listener:
+        if platform.system() != "Windows":
+            os.chmod(address, 0o600)
+        print(f"✓ OCR daemon listening on {address} (Ctrl+C to stop)")
+        try:
+            while True:
+                try:
+                    conn = listener.accept()
+                except AuthenticationError:
+                    # A client without the secret; drop it and keep serving
+                    continue
+                threading.Thread(target=_handle, args=(conn, readers), daemon=True).start()
+        except KeyboardInterrupt:
+            print("\nOCR daemon stopped")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Persistent EasyOCR service for evaluate_ocr.py")
+    parser.add_argument('--readers', type=int, default=1,
+                        help='EasyOCR readers serving requests concurrently (default: 1)')
+    args = parser.parse_args()
+    serve(num_readers=args.readers)
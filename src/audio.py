@@ -4,18 +4,93 @@ Provides cross-platform text-to-speech functionality for object detection alerts
 """
 
 import pyttsx3
+import hashlib
 import platform
+import queue
 import threading
 import time
 import logging
 from typing import Dict, Optional
 from .error_handler import get_error_handler, get_graceful_shutdown
 
+# Native speech APIs speak asynchronously on their own audio thread, so the
+# worker drives them directly instead of through pyttsx3's runAndWait loop
+try:
+    import pythoncom
+    import win32com.client
+    SAPI_AVAILABLE = True
+except ImportError:
+    SAPI_AVAILABLE = False
+
+try:
+    from AppKit import NSSpeechSynthesizer
+    NSSPEECH_AVAILABLE = True
+except ImportError:
+    NSSPEECH_AVAILABLE = False
+
+
+class _SapiVoice:
+    """SAPI5 voice driven directly over COM (Windows)."""
+    
+    def __init__(self):
+        # COM objects are bound to the thread that creates them
+        pythoncom.CoInitialize()
+        self._voice = win32com.client.Dispatch('SAPI.SpVoice')
+    
+    def set_rate(self, wpm: int) -> None:
+        # SAPI rates run from -10 to 10 with 0 at roughly 200 words per minute
+        self._voice.Rate = max(-10, min(10, round((wpm - 200) / 20)))
+    
+    def say(self, text: str) -> None:
+        self._voice.Speak(text, 1)  # SVSFlagsAsync
+    
+    def wait(self, timeout: float) -> bool:
+        return bool(self._voice.WaitUntilDone(int(timeout * 1000)))
+    
+    def stop(self) -> None:
+        self._voice.Speak("", 3)  # SVSFlagsAsync | SVSFPurgeBeforeSpeak
+    
+    def close(self) -> None:
+        self._voice = None
+        pythoncom.CoUninitialize()
+
+
+class _NSSpeechVoice:
+    """
+    NSSpeechSynthesizer voice (macOS).
+    
+    Completion is polled with isSpeaking: the didFinishSpeaking delegate is
+    delivered through a run loop, which the speech worker thread doesn't run.
+    A stop request therefore takes effect within one poll interval.
+    """
+    
+    def __init__(self):
+        self._synth = NSSpeechSynthesizer.alloc().initWithVoice_(None)
+    
+    def set_rate(self, wpm: int) -> None:
+        self._synth.setRate_(float(wpm))
+    
+    def say(self, text: str) -> None:
+        self._synth.startSpeakingString_(text)
+    
+    def wait(self, timeout: float) -> bool:
+        # Polling fallback: sleep one interval while speech is still playing
+        if self._synth.isSpeaking():
+            time.sleep(timeout)
+        return not self._synth.isSpeaking()
+    
+    def stop(self) -> None:
+        self._synth.stopSpeaking()
+    
+    def close(self) -> None:
+        self._synth = None
+
 
 class AudioManager:
     """
-    Cross-platform audio manager using pyttsx3 for text-to-speech functionality.
-    Supports Windows SAPI and macOS built-in TTS engines.
+    Cross-platform audio manager for text-to-speech functionality.
+    Speaks through SAPI (Windows) or NSSpeechSynthesizer (macOS) directly when
+    pywin32/pyobjc are installed, and through pyttsx3 otherwise.
     """
     
     # Simple alert message mapping for each object class
@@ -29,24 +104,95 @@ class AudioManager:
     # Scene announcement message format
     SCENE_MESSAGE_FORMAT = "Environment: {scene}"
     
-    def __init__(self, speech_rate: int = 200):
+    def __init__(self, speech_rate: int = 200, queue_size: int = 8,
+                 min_repeat_interval: float = 3.0):
         """
         Initialize the AudioManager with platform-specific TTS engine.
         
+        Speech is queued and played by a worker thread, so speak_* calls return
+        immediately instead of blocking for the length of the utterance.
+        
         Args:
             speech_rate: Speech rate in words per minute (default: 200)
+            queue_size: Messages that may wait for the speech worker; further
+                messages are dropped until it catches up (default: 8)
+            min_repeat_interval: Seconds during which a repeat of the same alert
+                class or OCR text is skipped; 0 disables (default: 3.0)
         """
         self.engine: Optional[pyttsx3.Engine] = None
         self.speech_rate = speech_rate
-        self._is_speaking = False
+        # Read lock-free by is_busy(): _speaking follows pyttsx3's utterance
+        # callbacks, _busy is set while any message is queued or playing
+        self._speaking = threading.Event()
+        self._busy = threading.Event()
+        self._pending = 0
+        self.min_repeat_interval = min_repeat_interval
+        self._last_spoken: Dict[object, float] = {}
         self._speech_lock = threading.Lock()
         self._use_fallback = False
         self.logger = logging.getLogger(__name__)
         
-        self._initialize_engine()
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._worker: Optional[threading.Thread] = None
+        self._native = None
+        self._voice_ready = threading.Event()
+        self._stop_requested = threading.Event()
+        
+        if not self._start_native_voice():
+            self._start_pyttsx3_voice()
+    
+    def _start_native_voice(self) -> bool:
+        """
+        Start the speech worker on the platform's native speech API.
+        
+        The voice is created on the worker thread, which owns it from then on.
+        
+        Returns:
+            True if a native voice is in use, False to fall back to pyttsx3
+        """
+        system = platform.system()
+        if system == "Windows" and SAPI_AVAILABLE:
+            factory = _SapiVoice
+        elif system == "Darwin" and NSSPEECH_AVAILABLE:
+            factory = _NSSpeechVoice
+        else:
+            return False
+        
+        self._worker = threading.Thread(target=self._run, args=(factory,), name="speech", daemon=True)
+        self._worker.start()
+        self._voice_ready.wait()
+        
+        if self._native is None:
+            self._worker = None
+            return False
+        
+        self.logger.info(f"Using native speech API: {factory.__name__}")
+        get_graceful_shutdown().register_shutdown_handler(self.cleanup)
+        return True
+    
+    def _start_pyttsx3_voice(self) -> None:
+        """
+        Start the speech worker on pyttsx3, or fall back to printed output.
+        
+        Like the native voices, the engine is created on the worker thread:
+        pyttsx3's sapi5 and nsss drivers wrap thread-affine COM and Cocoa
+        objects, so every call into the engine must come from that thread.
+        """
+        self._voice_ready.clear()
+        self._worker = threading.Thread(target=self._run, name="speech", daemon=True)
+        self._worker.start()
+        self._voice_ready.wait()
+        
+        if self.engine is None or self._use_fallback:
+            self._worker = None
+            return
+        
+        # Registered here because the shutdown handler installs signal
+        # handlers, which only the main thread may do
+        get_graceful_shutdown().register_shutdown_handler(self.cleanup)
     
     def _initialize_engine(self) -> None:
-        """Initialize pyttsx3 engine with platform-specific settings and error handling."""
+        """Initialize pyttsx3 engine with platform-specific settings and error handling (worker thread only)."""
         error_handler = get_error_handler()
         
         try:
@@ -74,10 +220,6 @@ class AudioManager:
             self.engine.connect('started-utterance', self._on_speech_start)
             self.engine.connect('finished-utterance', self._on_speech_end)
             
-            # Register cleanup with shutdown handler
-            shutdown_handler = get_graceful_shutdown()
-            shutdown_handler.register_shutdown_handler(self.cleanup)
-            
         except Exception as e:
             print(f"Warning: Failed to initialize TTS engine: {e}")
             
@@ -99,23 +241,151 @@ class AudioManager:
     
     def _on_speech_start(self, name: str) -> None:
         """Callback when speech starts."""
-        with self._speech_lock:
-            self._is_speaking = True
+        self._speaking.set()
     
     def _on_speech_end(self, name: str, completed: bool) -> None:
         """Callback when speech ends."""
-        with self._speech_lock:
-            self._is_speaking = False
+        self._speaking.clear()
     
     def is_busy(self) -> bool:
         """
-        Check if TTS is currently speaking.
+        Check if TTS is currently speaking or has messages waiting.
+        
+        Returns:
+            True if TTS is speaking or queued, False otherwise
+        """
+        return self._busy.is_set() or self._speaking.is_set()
+    
+    def _recently_spoken(self, key) -> bool:
+        """
+        Debounce repeated messages: check whether key was spoken within
+        min_repeat_interval.
+        
+        Args:
+            key: Hashable identity of the message
+            
+        Returns:
+            True if the message should be skipped as a repeat, False otherwise
+        """
+        if self.min_repeat_interval <= 0:
+            return False
+        
+        with self._speech_lock:
+            last = self._last_spoken.get(key)
+        return last is not None and time.monotonic() - last < self.min_repeat_interval
+    
+    def _mark_spoken(self, key) -> None:
+        """
+        Record key as spoken now. Called only once the message was actually
+        accepted, so a dropped message doesn't suppress its retry.
+        
+        Must be called with _speech_lock held.
+        
+        Args:
+            key: Hashable identity of the message
+        """
+        if self.min_repeat_interval <= 0:
+            return
+        
+        now = time.monotonic()
+        self._last_spoken[key] = now
+        
+        # OCR texts make the key space open-ended; forget expired entries
+        if len(self._last_spoken) > 64:
+            self._last_spoken = {k: t for k, t in self._last_spoken.items()
+                                 if now - t < self.min_repeat_interval}
+    
+    def _enqueue(self, message: str, kind: str, key=None) -> bool:
+        """
+        Hand a message to the speech worker without waiting for it to be spoken.
         
+        Args:
+            message: Text to speak
+            kind: Message type ('alert', 'text' or 'scene') for logging
+            key: Debounce key to record once the message is queued (optional)
+            
         Returns:
-            True if TTS is currently speaking, False otherwise
+            True if the message was queued, False if the queue is full
         """
         with self._speech_lock:
-            return self._is_speaking
+            try:
+                self._queue.put_nowait((message, kind))
+            except queue.Full:
+                self.logger.debug(f"Speech queue full, dropping {kind}: {message[:50]}")
+                return False
+            self._pending += 1
+            self._busy.set()
+            if key is not None:
+                self._mark_spoken(key)
+        return True
+    
+    def _speak_native(self, message: str) -> None:
+        """Speak through the native voice, returning when it finishes or is stopped."""
+        self._stop_requested.clear()
+        self._native.say(message)
+        while not self._native.wait(0.05):
+            if self._stop_requested.is_set():
+                self._native.stop()
+                break
+    
+    def _run(self, voice_factory=None) -> None:
+        """Speech worker: speak queued messages in order until a None sentinel."""
+        error_handler = get_error_handler()
+        
+        if voice_factory is not None:
+            try:
+                self._native = voice_factory()
+                self._native.set_rate(self.speech_rate)
+            except Exception as e:
+                self.logger.warning(f"Native speech API unavailable, using pyttsx3: {e}")
+                self._native = None
+            finally:
+                self._voice_ready.set()
+            if self._native is None:
+                return
+        else:
+            try:
+                self._initialize_engine()
+            finally:
+                self._voice_ready.set()
+            if self.engine is None or self._use_fallback:
+                return
+        applied_rate = self.speech_rate
+        
+        while True:
+            message, kind = self._queue.get()
+            if message is None:
+                break
+            
+            try:
+                if self._native is not None:
+                    if self.speech_rate != applied_rate:
+                        self._native.set_rate(self.speech_rate)
+                        applied_rate = self.speech_rate
+                    self._speak_native(message)
+                else:
+                    if self.speech_rate != applied_rate:
+                        self.engine.setProperty('rate', self.speech_rate)
+                        applied_rate = self.speech_rate
+                    self.engine.say(message)
+                    self.engine.runAndWait()
+            except Exception as e:
+                self.logger.error(f"Error speaking {kind}: {e}")
+                
+                # Try error recovery
+                context = {"message": message[:100], "type": kind}
+                if error_handler.handle_error("tts_error", e, context):
+                    # Try fallback
+                    print(f"AUDIO {kind.upper()}: {message}")
+                    self.logger.info(f"Audio {kind} (fallback after error): {message[:100]}")
+            finally:
+                with self._speech_lock:
+                    self._pending -= 1
+                    if self._pending == 0:
+                        self._busy.clear()
+        
+        if self._native is not None:
+            self._native.close()
     
     def speak_alert(self, object_class: str) -> bool:
         """
@@ -125,39 +395,25 @@ class AudioManager:
             object_class: The class name of the detected object
             
         Returns:
-            True if alert was spoken successfully, False otherwise
+            True if alert was queued for speech, False otherwise
         """
+        # Skip if the same class was announced moments ago
+        key = ('alert', object_class)
+        if self._recently_spoken(key):
+            return False
+        
         # Get alert message for the object class
         message = self.ALERT_MESSAGES.get(object_class, f"{object_class} detected")
         
-        if not self.engine or self._use_fallback:
+        if self._worker is None:
             # Use fallback output
             print(f"AUDIO ALERT: {message}")
             self.logger.info(f"Audio alert (fallback): {message}")
+            with self._speech_lock:
+                self._mark_spoken(key)
             return True
         
-        # Don't interrupt if already speaking
-        if self.is_busy():
-            return False
-        
-        error_handler = get_error_handler()
-        
-        try:
-            self.engine.say(message)
-            self.engine.runAndWait()
-            return True
-        except Exception as e:
-            self.logger.error(f"Error speaking alert: {e}")
-            
-            # Try error recovery
-            context = {"message": message, "type": "alert"}
-            if error_handler.handle_error("tts_error", e, context):
-                # Try fallback
-                print(f"AUDIO ALERT: {message}")
-                self.logger.info(f"Audio alert (fallback after error): {message}")
-                return True
-            
-            return False
+        return self._enqueue(message, "alert", key)
     
     def speak_text(self, text: str) -> bool:
         """
@@ -167,41 +423,27 @@ class AudioManager:
             text: The text to be spoken
             
         Returns:
-            True if text was spoken successfully, False otherwise
+            True if text was queued for speech, False otherwise
         """
         # Clean up text for better speech
         cleaned_text = text.strip()
         if not cleaned_text:
             cleaned_text = "No text found"
         
-        if not self.engine or self._use_fallback:
+        # Skip re-reading the same text, e.g. the same OCR result on adjacent frames
+        key = ('text', hashlib.blake2b(cleaned_text.encode(), digest_size=8).digest())
+        if self._recently_spoken(key):
+            return False
+        
+        if self._worker is None:
             # Use fallback output
             print(f"AUDIO TEXT: {cleaned_text}")
             self.logger.info(f"Audio text (fallback): {cleaned_text[:100]}...")
+            with self._speech_lock:
+                self._mark_spoken(key)
             return True
         
-        # Don't interrupt if already speaking
-        if self.is_busy():
-            return False
-        
-        error_handler = get_error_handler()
-        
-        try:
-            self.engine.say(cleaned_text)
-            self.engine.runAndWait()
-            return True
-        except Exception as e:
-            self.logger.error(f"Error speaking text: {e}")
-            
-            # Try error recovery
-            context = {"text": cleaned_text[:100], "type": "text"}
-            if error_handler.handle_error("tts_error", e, context):
-                # Try fallback
-                print(f"AUDIO TEXT: {cleaned_text}")
-                self.logger.info(f"Audio text (fallback after error): {cleaned_text[:100]}...")
-                return True
-            
-            return False
+        return self._enqueue(cleaned_text, "text", key)
     
     def speak_scene(self, scene: str) -> bool:
         """
@@ -211,42 +453,36 @@ class AudioManager:
             scene: The scene/environment label to announce
             
         Returns:
-            True if scene was announced successfully, False otherwise
+            True if scene was queued for announcement, False otherwise
         """
         message = self.SCENE_MESSAGE_FORMAT.format(scene=scene)
         
-        if not self.engine or self._use_fallback:
+        if self._worker is None:
             # Use fallback output
             print(f"AUDIO SCENE: {message}")
             self.logger.info(f"Audio scene (fallback): {message}")
             return True
         
-        # Don't interrupt if already speaking
-        if self.is_busy():
-            return False
-        
-        error_handler = get_error_handler()
-        
-        try:
-            self.engine.say(message)
-            self.engine.runAndWait()
-            return True
-        except Exception as e:
-            self.logger.error(f"Error speaking scene: {e}")
-            
-            # Try error recovery
-            context = {"message": message, "type": "scene"}
-            if error_handler.handle_error("tts_error", e, context):
-                # Try fallback
-                print(f"AUDIO SCENE: {message}")
-                self.logger.info(f"Audio scene (fallback after error): {message}")
-                return True
-            
-            return False
+        return self._enqueue(message, "scene")
+    
+    def _clear_queue(self) -> None:
+        """Drop messages that are still waiting for the speech worker."""
+        with self._speech_lock:
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._pending -= 1
+            if self._pending == 0:
+                self._busy.clear()
     
     def stop_speaking(self) -> None:
-        """Stop current speech if speaking."""
-        if self.engine and self.is_busy():
+        """Stop current speech if speaking and drop queued messages."""
+        self._clear_queue()
+        if self._native is not None:
+            self._stop_requested.set()
+        elif self.engine and self.is_busy():
             try:
                 self.engine.stop()
             except Exception as e:
@@ -259,25 +495,26 @@ class AudioManager:
         Args:
             rate: New speech rate in words per minute
         """
-        if self.engine:
-            try:
-                self.engine.setProperty('rate', rate)
-                self.speech_rate = rate
-            except Exception as e:
-                print(f"Error setting speech rate: {e}")
+        # Applied by the worker, which owns the voice, before the next utterance
+        self.speech_rate = rate
     
     def cleanup(self) -> None:
         """Clean up resources with comprehensive error handling."""
         try:
-            if self.engine:
+            if self.engine or self._worker is not None:
                 self.logger.info("Cleaning up audio manager...")
                 self.stop_speaking()
-                # Give time for cleanup
-                time.sleep(0.1)
+                
+                # Let the worker finish its current utterance and exit
+                if self._worker is not None:
+                    self._queue.put((None, None), timeout=1.0)
+                    self._worker.join(timeout=2.0)
+                    self._worker = None
                 
                 # Try to properly shutdown the engine
                 try:
-                    self.engine.stop()
+                    if self.engine:
+                        self.engine.stop()
                 except:
                     pass  # Ignore errors during shutdown
                 
@@ -318,6 +555,10 @@ def test_audio_manager():
     print("Testing is_busy method...")
     print(f"Is busy: {audio_manager.is_busy()}")
     
+    # Speech is queued, so let it play out before cleaning up
+    while audio_manager.is_busy():
+        time.sleep(0.1)
+    
     audio_manager.cleanup()
     print("AudioManager test complete.")
 
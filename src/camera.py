@@ -6,9 +6,21 @@ Provides webcam access and frame capture functionality with graceful error handl
 import cv2
 import numpy as np
 import logging
+import os
+import platform
+import threading
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple
 from .error_handler import get_error_handler, get_graceful_shutdown
 
+# MSMF's hardware transforms make opening a webcam take seconds on many
+# drivers and add a conversion stage per frame; OpenCV reads this when the
+# backend is first used, so it only has to precede the first VideoCapture
+if platform.system() == "Windows":
+    os.environ.setdefault('OPENCV_VIDEOIO_MSMF_ENABLE_HW_TRANSFORMS', '0')
+
 
 class CameraInterface:
     """
@@ -18,45 +30,127 @@ class CameraInterface:
     with comprehensive error handling for common camera access issues.
     """
     
-    def __init__(self):
-        """Initialize the camera interface."""
+    # Capture backends selectable by name; 'auto' picks per platform
+    BACKENDS = {
+        'dshow': 'CAP_DSHOW',
+        'msmf': 'CAP_MSMF',
+        'v4l2': 'CAP_V4L2',
+        'avfoundation': 'CAP_AVFOUNDATION',
+    }
+    
+    # Frame layouts get_frame() can return, with the in-place conversion from
+    # the BGR frames OpenCV decodes
+    PIXEL_FORMATS = {
+        'BGR': None,
+        'RGB': cv2.COLOR_BGR2RGB,
+        'YUV': cv2.COLOR_BGR2YUV,
+    }
+    
+    # Longest get_frame() waits for the grabber thread to deliver a new frame
+    FRAME_WAIT_TIMEOUT = 1.0
+    
+    def __init__(self, buffer_size: int = 0, backend: str = 'auto'):
+        """
+        Initialize the camera interface.
+        
+        Args:
+            buffer_size: Number of recent frames to queue for the consumer (0 keeps
+                only the newest one). With a queue, get_frame() returns frames in
+                capture order so a consumer recovering from a short stall catches
+                up on the burst instead of skipping it; once the queue is full the
+                oldest frames are dropped, so long stalls don't grow memory.
+            backend: Capture backend name from BACKENDS, or 'auto' for the
+                platform's native one. DirectShow opens much faster than MSMF
+                on some Windows drivers.
+        """
+        if buffer_size < 0:
+            raise ValueError(f"buffer_size must be non-negative, got {buffer_size}")
+        if backend != 'auto' and backend not in self.BACKENDS:
+            raise ValueError(f"backend must be 'auto' or one of {sorted(self.BACKENDS)}, got {backend}")
+        
         self.camera: Optional[cv2.VideoCapture] = None
         self.is_initialized = False
         self.camera_index = 0
+        self.buffer_size = buffer_size
+        self.backend = backend
+        self.pixel_format = 'BGR'
+        self._cvt_code: Optional[int] = None
+        self._error_handler = None  # Looked up once in initialize_camera()
+        self._read_executor: Optional[ThreadPoolExecutor] = None  # Created by get_frame_async()
+        self._info: Optional[dict] = None  # Capture properties, queried once per initialization
         
-        # Set up logging
-        logging.basicConfig(level=logging.INFO)
+        # Background grabber state (used when the driver ignores the
+        # CAP_PROP_BUFFERSIZE hint and would otherwise hand out stale frames,
+        # and always when frames are queued)
+        self._grab_thread: Optional[threading.Thread] = None
+        self._grab_exited = threading.Event()  # Set by the grabber as it exits
+        self._stop_event = threading.Event()
+        self._frame_lock = threading.Lock()
+        self._frame_ready = threading.Condition(self._frame_lock)
+        self._frame_seq = 0   # Frames published by the grabber
+        self._served_seq = 0  # Last frame handed out by get_frame()
+        self._latest_frame: Optional[np.ndarray] = None
+        self._buf: Optional[deque] = deque(maxlen=buffer_size) if buffer_size else None
+        self._frame_buf: Optional[np.ndarray] = None  # Shaped from the test frame
+        
+        # Without a frame queue the grabber decodes into three rotating slots:
+        # the one holding the newest frame, the one last handed to a reusing
+        # consumer, and a free one to write into, so it never writes a frame
+        # that is being read
+        self._slots: Optional[list] = None
+        self._front = 0
+        self._held = -1
+        
+        # Logging is configured by the application, not per instance
         self.logger = logging.getLogger(__name__)
     
-    def initialize_camera(self, camera_index: int = 0) -> bool:
+    def initialize_camera(self, camera_index: int = 0, pixel_format: Optional[str] = None) -> bool:
         """
         Initialize the camera using OpenCV VideoCapture with comprehensive error handling.
         
         Args:
             camera_index (int): Camera index to use (default: 0 for primary camera)
+            pixel_format (str): Layout of returned frames, one of PIXEL_FORMATS.
+                Frames are BGR unless a format is requested; None keeps the
+                current one, so reinitializing after a failure doesn't reset it.
+                Conversion happens in place on the decoded frame, so models that
+                want RGB don't need a converted copy of every frame.
             
         Returns:
             bool: True if camera initialized successfully, False otherwise
         
         Raises:
-            ValueError: If camera_index is negative
+            ValueError: If camera_index is negative or pixel_format is unknown
         """
         # Validate camera index
         if camera_index < 0:
             raise ValueError(f"camera_index must be non-negative, got {camera_index}")
+        if pixel_format is not None:
+            if pixel_format not in self.PIXEL_FORMATS:
+                raise ValueError(f"pixel_format must be one of {list(self.PIXEL_FORMATS)}, got {pixel_format}")
+            self.pixel_format = pixel_format
+            self._cvt_code = self.PIXEL_FORMATS[pixel_format]
         
-        error_handler = get_error_handler()
+        error_handler = self._error_handler = get_error_handler()
         
         try:
             self.camera_index = camera_index
-            self.logger.info(f"Attempting to initialize camera with index {camera_index}")
+            self.logger.info("Attempting to initialize camera with index %d", camera_index)
+            
+            # Stop any grabber left over from a previous initialization
+            self._stop_grabber()
+            self._info = None
             
-            # Create VideoCapture object
-            self.camera = cv2.VideoCapture(camera_index)
+            # Create VideoCapture object on the platform's native backend
+            self.camera = self._open_capture(camera_index)
+            
+            # Keep only the newest frame in the driver queue so get_frame()
+            # does not return images several frames behind reality
+            buffer_hint_applied = self._set_buffer_size(1)
             
             # Check if camera opened successfully
             if not self.camera.isOpened():
-                self.logger.error(f"Failed to open camera with index {camera_index}")
+                self.logger.error("Failed to open camera with index %d", camera_index)
                 self.camera = None
                 
                 # Try error recovery
@@ -90,12 +184,23 @@ class CameraInterface:
                 self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
                 self.camera.set(cv2.CAP_PROP_FPS, 30)
             except Exception as e:
-                self.logger.warning(f"Could not set camera properties: {e}")
+                self.logger.warning("Could not set camera properties: %s", e)
                 # Continue anyway as this is not critical
             
+            test_frame = self._convert(test_frame)
+            self._frame_buf = np.empty_like(test_frame)
+            
             self.is_initialized = True
             self.logger.info("Camera initialized successfully")
             
+            # Drain the driver queue ourselves if it ignored the buffer hint,
+            # or to feed the frame queue
+            if self._buf is not None:
+                self._start_grabber(test_frame)
+            elif not buffer_hint_applied:
+                self.logger.info("Camera backend ignored buffer size hint, starting frame grabber thread")
+                self._start_grabber(test_frame)
+            
             # Register cleanup with shutdown handler
             shutdown_handler = get_graceful_shutdown()
             shutdown_handler.register_shutdown_handler(self.release)
@@ -103,20 +208,61 @@ class CameraInterface:
             return True
             
         except cv2.error as e:
-            self.logger.error(f"OpenCV error during camera initialization: {e}")
+            self.logger.error("OpenCV error during camera initialization: %s", e)
             self.camera = None
             error_handler.handle_error("camera_error", e, {"camera_index": camera_index})
             return False
         except Exception as e:
-            self.logger.error(f"Unexpected error during camera initialization: {e}")
+            self.logger.error("Unexpected error during camera initialization: %s", e)
             self.camera = None
             error_handler.handle_error("camera_error", e, {"camera_index": camera_index})
             return False
     
-    def get_frame(self) -> Optional[np.ndarray]:
+    def grab(self) -> bool:
+        """
+        Advance the capture to the next frame without decoding it.
+        
+        Returns:
+            bool: True if a frame was grabbed, False otherwise
+        """
+        if not self.is_initialized or self.camera is None:
+            return False
+        return self.camera.grab()
+    
+    def retrieve(self, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """
+        Decode the most recently grabbed frame.
+        
+        Args:
+            out: Optional preallocated buffer to decode into
+        
+        Returns:
+            Optional[np.ndarray]: Decoded frame, or None if retrieval fails
+        """
+        if not self.is_initialized or self.camera is None:
+            return None
+        ret, frame = self.camera.retrieve() if out is None else self.camera.retrieve(out)
+        return self._convert(frame) if ret and frame is not None else None
+    
+    def get_frame(self, out: Optional[np.ndarray] = None, skip: int = 0,
+                  reuse: bool = False) -> Optional[np.ndarray]:
         """
         Capture and return the current webcam frame with error handling and recovery.
         
+        Args:
+            out: Optional preallocated buffer to decode into. It is used when its
+                shape and dtype match the camera's frames; otherwise a new array
+                is returned.
+            skip: Number of frames to grab and discard without decoding before
+                the returned one, for callers that subsample the stream. Ignored
+                while the grabber thread owns the capture.
+            reuse: Decode into a buffer owned by the camera instead of a new
+                array, saving one frame allocation per call. The returned frame
+                is overwritten by the next reusing call, so callers that keep it
+                must copy it. While the grabber thread runs, the returned frame
+                stays valid until the next get_frame() call. Ignored when out is
+                given.
+        
         Returns:
             Optional[np.ndarray]: Current frame as numpy array, or None if capture fails
         """
@@ -124,40 +270,142 @@ class CameraInterface:
             self.logger.warning("Camera not initialized. Call initialize_camera() first.")
             return None
         
-        error_handler = get_error_handler()
+        if self._buf is not None:
+            with self._frame_lock:
+                # Wait for the grabber rather than returning None at once, which
+                # callers would treat as a read failure
+                self._frame_ready.wait_for(lambda: self._buf or self._stop_event.is_set(),
+                                           timeout=self.FRAME_WAIT_TIMEOUT)
+                try:
+                    return self._buf.popleft()
+                except IndexError:
+                    return None
+        
+        if self._grab_thread is not None:
+            with self._frame_lock:
+                # Block until a frame newer than the last one served arrives,
+                # like a direct read would, so polling callers neither spin nor
+                # process the same frame twice
+                if not self._frame_ready.wait_for(
+                        lambda: self._frame_seq != self._served_seq or self._stop_event.is_set(),
+                        timeout=self.FRAME_WAIT_TIMEOUT):
+                    return None
+                latest = self._latest_frame
+                if latest is None:
+                    return None
+                self._served_seq = self._frame_seq
+                if out is not None and out.shape == latest.shape and out.dtype == latest.dtype:
+                    np.copyto(out, latest)
+                    return out
+                if self._slots is None:
+                    return latest
+                if reuse:
+                    # Pin the slot so the grabber writes around it
+                    self._held = self._front
+                    return latest
+                return latest.copy()
         
         try:
-            ret, frame = self.camera.read()
-            
-            if not ret:
-                self.logger.warning("Failed to capture frame from camera")
-                
-                # Try error recovery
-                context = {"camera_index": self.camera_index, "issue": "frame_read_failed"}
-                if error_handler.handle_error("camera_error", Exception("Frame read failed"), context):
-                    # Try to reinitialize camera
-                    if self.initialize_camera(self.camera_index):
-                        # Retry frame capture once
-                        ret, frame = self.camera.read()
-                        if ret and frame is not None:
-                            return frame
-                
-                return None
-            
-            if frame is None:
-                self.logger.warning("Captured frame is None")
-                return None
-            
-            return frame
+            frame = self._read_fast(out, skip, reuse)
+            return frame if frame is not None else self._recover()
             
         except cv2.error as e:
-            self.logger.error(f"OpenCV error during frame capture: {e}")
-            error_handler.handle_error("camera_error", e, {"camera_index": self.camera_index})
+            self.logger.error("OpenCV error during frame capture: %s", e)
+            self._error_handler.handle_error("camera_error", e, {"camera_index": self.camera_index})
             return None
         except Exception as e:
-            self.logger.error(f"Unexpected error during frame capture: {e}")
-            error_handler.handle_error("camera_error", e, {"camera_index": self.camera_index})
+            self.logger.error("Unexpected error during frame capture: %s", e)
+            self._error_handler.handle_error("camera_error", e, {"camera_index": self.camera_index})
+            return None
+    
+    def _read_fast(self, out: Optional[np.ndarray], skip: int, reuse: bool) -> Optional[np.ndarray]:
+        """
+        Read one frame with no logging or error bookkeeping.
+        
+        Returns:
+            Optional[np.ndarray]: The frame, or None if the read failed
+        """
+        # grab() only advances the stream, so skipped frames cost no decode
+        for _ in range(skip):
+            if not self.camera.grab():
+                break
+        
+        if out is None and reuse:
+            out = self._frame_buf
+        ret, frame = self.camera.read() if out is None else self.camera.read(out)
+        if not ret or frame is None:
             return None
+        if reuse:
+            # Adopt whatever OpenCV decoded into, in case the resolution
+            # changed after the test frame and it had to reallocate
+            self._frame_buf = frame
+        return self._convert(frame)
+    
+    def _convert(self, frame: np.ndarray) -> np.ndarray:
+        """Convert a freshly decoded BGR frame to the requested pixel format in place."""
+        if self._cvt_code is not None:
+            cv2.cvtColor(frame, self._cvt_code, dst=frame)
+        return frame
+    
+    def _recover(self) -> Optional[np.ndarray]:
+        """
+        Handle a failed read: report it, reinitialize the camera and retry once.
+        
+        Returns:
+            Optional[np.ndarray]: Frame from the retry, or None if recovery failed
+        """
+        self.logger.warning("Failed to capture frame from camera")
+        
+        context = {"camera_index": self.camera_index, "issue": "frame_read_failed"}
+        if self._error_handler.handle_error("camera_error", Exception("Frame read failed"), context):
+            # Try to reinitialize camera
+            if self.initialize_camera(self.camera_index):
+                # Retry frame capture once
+                ret, frame = self.camera.read()
+                if ret and frame is not None:
+                    return self._convert(frame)
+        
+        return None
+    
+    async def get_frame_async(self, out: Optional[np.ndarray] = None, skip: int = 0,
+                              reuse: bool = False) -> Optional[np.ndarray]:
+        """
+        Awaitable get_frame() for callers running an asyncio event loop.
+        
+        get_frame() blocks until a new frame is available, so it runs on a
+        single dedicated thread; reads stay serialized and the loop keeps
+        servicing other stages meanwhile.
+        
+        Args:
+            out, skip, reuse: As for get_frame()
+        
+        Returns:
+            Optional[np.ndarray]: Current frame, or None if capture fails
+        """
+        if self._read_executor is None:
+            self._read_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="camera-read")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._read_executor, self.get_frame, out, skip, reuse)
+    
+    def get_latest_drop_older(self) -> Optional[np.ndarray]:
+        """
+        Return the newest queued frame and discard everything older.
+        
+        For consumers that fell too far behind to want the backlog. Without a
+        frame queue this is the same as get_frame().
+        
+        Returns:
+            Optional[np.ndarray]: Newest frame, or None if none is queued
+        """
+        if self._buf is None:
+            return self.get_frame()
+        
+        with self._frame_lock:
+            if not self._buf:
+                return None
+            latest = self._buf.pop()
+            self._buf.clear()
+            return latest
     
     def release(self) -> None:
         """
@@ -166,18 +414,225 @@ class CameraInterface:
         Should be called when done using the camera to free system resources.
         """
         try:
+            # Stop the grabber and any async read before releasing the capture
+            # they read from
+            self._stop_grabber()
+            if self._read_executor is not None:
+                self._read_executor.shutdown(wait=True)
+                self._read_executor = None
+            
             if self.camera is not None:
                 self.logger.info("Releasing camera resources")
                 self.camera.release()
                 self.camera = None
             
             self.is_initialized = False
+            self._info = None
             
             # Destroy any OpenCV windows that might be open
             cv2.destroyAllWindows()
             
         except Exception as e:
-            self.logger.error(f"Error during camera resource cleanup: {e}")
+            self.logger.error("Error during camera resource cleanup: %s", e)
+    
+    def _preferred_backend(self) -> int:
+        """
+        Pick the configured capture backend, or the native one for the platform.
+        
+        Returns:
+            int: OpenCV apiPreference constant (CAP_ANY when there is no preference)
+        """
+        if self.backend != 'auto':
+            return getattr(cv2, self.BACKENDS[self.backend], cv2.CAP_ANY)
+        
+        system = platform.system()
+        if system == "Windows":
+            return getattr(cv2, "CAP_MSMF", cv2.CAP_ANY)
+        if system == "Darwin":
+            return getattr(cv2, "CAP_AVFOUNDATION", cv2.CAP_ANY)
+        if system == "Linux":
+            # V4L2 directly honors CAP_PROP_BUFFERSIZE; CAP_ANY may pick GStreamer
+            return getattr(cv2, "CAP_V4L2", cv2.CAP_ANY)
+        return cv2.CAP_ANY
+    
+    def _open_capture(self, camera_index: int) -> cv2.VideoCapture:
+        """
+        Open a VideoCapture on the native backend, falling back to OpenCV's default.
+        
+        Args:
+            camera_index: Camera index to open
+            
+        Returns:
+            cv2.VideoCapture: The capture object (may not be opened)
+        """
+        backend = self._preferred_backend()
+        camera = cv2.VideoCapture(camera_index, backend)
+        if backend != cv2.CAP_ANY and not camera.isOpened():
+            self.logger.warning("Preferred camera backend unavailable, falling back to default backend")
+            camera.release()
+            camera = cv2.VideoCapture(camera_index)
+        
+        if camera.isOpened():
+            # USB webcams default to raw YUYV, which saturates the bus above
+            # 640x480; MJPG is compressed on the wire and decoded with SIMD.
+            # Drivers that reject it keep their default. Many drivers only
+            # accept a format change before the resolution is set.
+            camera.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+            try:
+                backend_name = camera.getBackendName()
+            except cv2.error:
+                backend_name = "unknown"
+            self.logger.info("Camera backend: %s, pixel format: %s", backend_name, self._fourcc_name(camera) or 'unknown')
+        
+        return camera
+    
+    @staticmethod
+    def _fourcc_name(camera: cv2.VideoCapture) -> Optional[str]:
+        """
+        Decode a capture's negotiated pixel format into its four-letter code.
+        
+        Args:
+            camera: Opened capture to query
+            
+        Returns:
+            Optional[str]: Codec such as 'MJPG' or 'YUYV', or None if the backend
+                doesn't report one
+        """
+        code = int(camera.get(cv2.CAP_PROP_FOURCC))
+        if code <= 0:
+            return None
+        return ''.join(chr((code >> (8 * i)) & 0xFF) for i in range(4))
+    
+    def _set_buffer_size(self, size: int) -> bool:
+        """
+        Ask the capture backend to limit its internal frame queue.
+        
+        Only live camera captures (V4L2, MSMF, DirectShow) honor this; file and
+        stream captures ignore it.
+        
+        Args:
+            size: Number of frames the driver should buffer
+            
+        Returns:
+            bool: True if the backend accepted the hint, False otherwise
+        """
+        try:
+            self.camera.set(cv2.CAP_PROP_BUFFERSIZE, size)
+            return int(self.camera.get(cv2.CAP_PROP_BUFFERSIZE)) == size
+        except Exception as e:
+            self.logger.warning("Could not set camera buffer size: %s", e)
+            return False
+    
+    def _start_grabber(self, initial_frame: Optional[np.ndarray] = None) -> None:
+        """
+        Start a daemon thread that keeps only the newest frame available.
+        
+        Args:
+            initial_frame: Frame to serve until the thread delivers its first one
+        """
+        self._stop_event.clear()
+        self._latest_frame = initial_frame
+        if initial_frame is not None:
+            self._frame_seq += 1
+        if self._buf is not None:
+            self._buf.clear()
+            if initial_frame is not None:
+                self._buf.append(initial_frame)
+        elif initial_frame is not None:
+            self._slots = [initial_frame, np.empty_like(initial_frame), np.empty_like(initial_frame)]
+            self._front = 0
+            self._held = -1
+        self._grab_exited = threading.Event()
+        self._grab_thread = threading.Thread(target=self._grab_loop, args=(self._grab_exited,),
+                                             name="camera-grabber", daemon=True)
+        self._grab_thread.start()
+    
+    def _stop_grabber(self) -> None:
+        """
+        Signal the grabber thread to stop and wait for it to exit.
+        
+        A grabber still blocked in a read after the timeout (normal for an
+        unplugged device) is handed the capture: it is detached from this
+        interface and the thread releases it once the read returns, since
+        releasing a VideoCapture mid-read on another thread is unsafe.
+        """
+        if self._grab_thread is None:
+            return
+        
+        self._stop_event.set()
+        with self._frame_lock:
+            # Release consumers waiting in get_frame()
+            self._frame_ready.notify_all()
+        if self._grab_thread.is_alive():
+            self._grab_thread.join(timeout=1.0)
+        with self._frame_lock:
+            if not self._grab_exited.is_set():
+                self.logger.warning("Frame grabber still blocked in a read; it will release the camera on exit")
+                self.camera = None
+            self._grab_thread = None
+            self._latest_frame = None
+            self._slots = None
+            if self._buf is not None:
+                self._buf.clear()
+    
+    def _grab_loop(self, exited: threading.Event) -> None:
+        """
+        Continuously read frames so the driver queue never holds stale ones.
+        
+        Args:
+            exited: Event set on exit, under the frame lock
+        """
+        camera = self.camera
+        try:
+            self._grab_frames(camera)
+        finally:
+            with self._frame_lock:
+                exited.set()
+                # Detached by _stop_grabber while this thread was blocked in a read
+                detached = camera is not self.camera
+            if detached and camera is not None:
+                camera.release()
+    
+    def _grab_frames(self, camera) -> None:
+        """Read frames from camera until this thread is stopped or replaced."""
+        me = threading.current_thread()
+        consecutive_failures = 0
+        slots = self._slots
+        while not self._stop_event.is_set() and self._grab_thread is me:
+            back = -1
+            if slots is not None:
+                with self._frame_lock:
+                    back = next(i for i in range(3) if i != self._front and i != self._held)
+            
+            try:
+                ret, frame = camera.read() if back < 0 else camera.read(slots[back])
+            except Exception as e:
+                self.logger.error("Error in frame grabber: %s", e)
+                ret, frame = False, None
+            
+            if ret and frame is not None:
+                consecutive_failures = 0
+                self._convert(frame)
+                with self._frame_lock:
+                    if self._stop_event.is_set() or self._grab_thread is not me:
+                        break  # Stopped while blocked in the read; publish nothing
+                    if back >= 0:
+                        # Keep OpenCV's reallocation if the frame size changed
+                        slots[back] = frame
+                        self._front = back
+                    self._latest_frame = frame
+                    if self._buf is not None:
+                        self._buf.append(frame)
+                    self._frame_seq += 1
+                    self._frame_ready.notify_all()
+            else:
+                consecutive_failures += 1
+                if consecutive_failures == 10:
+                    # Stop serving a frozen image so callers can trigger recovery
+                    with self._frame_lock:
+                        self._latest_frame = None
+                # Avoid spinning on a camera that stopped delivering frames
+                self._stop_event.wait(0.01)
     
     def get_camera_info(self) -> dict:
         """
@@ -192,20 +647,32 @@ class CameraInterface:
                 'camera_index': self.camera_index,
                 'width': None,
                 'height': None,
-                'fps': None
+                'fps': None,
+                'backend': None,
+                'fourcc': None,
+                'queued_frames': 0
             }
         
-        try:
-            return {
-                'initialized': True,
-                'camera_index': self.camera_index,
-                'width': int(self.camera.get(cv2.CAP_PROP_FRAME_WIDTH)),
-                'height': int(self.camera.get(cv2.CAP_PROP_FRAME_HEIGHT)),
-                'fps': int(self.camera.get(cv2.CAP_PROP_FPS))
-            }
-        except Exception as e:
-            self.logger.error(f"Error getting camera info: {e}")
-            return {'error': str(e)}
+        # Properties are fixed once the camera is set up, and each get() can
+        # be a driver query, so they are only read on the first call
+        if self._info is None:
+            try:
+                self._info = {
+                    'initialized': True,
+                    'camera_index': self.camera_index,
+                    'width': int(self.camera.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                    'height': int(self.camera.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                    'fps': int(self.camera.get(cv2.CAP_PROP_FPS)),
+                    'backend': self.camera.getBackendName(),
+                    'fourcc': self._fourcc_name(self.camera)
+                }
+            except Exception as e:
+                self.logger.error("Error getting camera info: %s", e)
+                return {'error': str(e)}
+        
+        info = dict(self._info)
+        info['queued_frames'] = len(self._buf) if self._buf is not None else 0
+        return info
     
     def __enter__(self):
         """Context manager entry."""
@@ -216,6 +683,147 @@ class CameraInterface:
         self.release()
 
 
+class FrameGrabber:
+    """
+    Background capture thread that keeps only the latest frame.
+    
+    Decouples camera reads from the processing loop: the loop asks for the
+    newest frame without blocking (or waits on a condition until one
+    arrives), and a sequence counter tells it whether the frame is new since
+    it last looked.
+    
+    With a ring buffer, frames are decoded into preallocated slots instead of
+    a fresh array per read. A returned frame then stays valid only until
+    ring_size - 1 further frames have been grabbed, so consumers that keep a
+    frame longer than that must copy it.
+    """
+    
+    def __init__(self, camera: CameraInterface, camera_index: int = 0, max_failures: int = 10,
+                 ring_size: int = 0):
+        """
+        Initialize the grabber.
+        
+        Args:
+            camera: Initialized CameraInterface to read from
+            camera_index: Index used to reinitialize the camera on recovery
+            max_failures: Consecutive read failures before attempting recovery
+            ring_size: Number of preallocated frame slots (0 allocates per frame).
+                At least 3 is needed so the slot being written is never one the
+                display or detection consumer is still reading.
+        """
+        if ring_size and ring_size < 3:
+            raise ValueError(f"ring_size must be 0 or at least 3, got {ring_size}")
+        
+        self.camera = camera
+        self.camera_index = camera_index
+        self.max_failures = max_failures
+        self.logger = logging.getLogger(__name__)
+        
+        self.lost = threading.Event()  # Set when the camera could not be recovered
+        self._stop_event = threading.Event()
+        self._frame_ready = threading.Condition()
+        self._latest: Optional[np.ndarray] = None
+        self._seq = 0
+        self._thread: Optional[threading.Thread] = None
+        self.ring_size = ring_size
+        self._ring: Optional[np.ndarray] = None  # Allocated from the first frame's shape
+    
+    def start(self) -> None:
+        """Start the capture thread."""
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="frame-grabber", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop the capture thread and wait for it to exit."""
+        self._stop_event.set()
+        with self._frame_ready:
+            self._frame_ready.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+    
+    def latest(self, last_seq: int = -1) -> Tuple[int, Optional[np.ndarray]]:
+        """
+        Return the newest frame if it is newer than last_seq.
+        
+        Args:
+            last_seq: Sequence number of the frame the caller last processed
+            
+        Returns:
+            Tuple of (seq, frame); frame is None when nothing new has arrived
+        """
+        with self._frame_ready:
+            return self._take(last_seq)
+    
+    def wait_for_frame(self, last_seq: int = -1, timeout: float = 0.05) -> Tuple[int, Optional[np.ndarray]]:
+        """
+        Block until a frame newer than last_seq arrives, or the timeout expires.
+        
+        Wakes immediately on a new frame instead of polling, and also when the
+        grabber stops or the camera is lost.
+        
+        Args:
+            last_seq: Sequence number of the frame the caller last processed
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            Tuple of (seq, frame); frame is None on timeout or shutdown
+        """
+        with self._frame_ready:
+            self._frame_ready.wait_for(
+                lambda: (self._seq != last_seq and self._latest is not None)
+                or self._stop_event.is_set() or self.lost.is_set(),
+                timeout=timeout
+            )
+            return self._take(last_seq)
+    
+    def _take(self, last_seq: int) -> Tuple[int, Optional[np.ndarray]]:
+        """Return (seq, frame) if newer than last_seq; caller holds the condition."""
+        if self._seq == last_seq or self._latest is None:
+            return last_seq, None
+        return self._seq, self._latest
+    
+    def _publish(self, frame: np.ndarray) -> None:
+        """Replace the latest frame (latest wins) and wake waiting consumers."""
+        with self._frame_ready:
+            self._latest = frame
+            self._seq += 1
+            self._frame_ready.notify_all()
+    
+    def _run(self) -> None:
+        """Capture frames, backing off and recovering on failures."""
+        consecutive_failures = 0
+        
+        while not self._stop_event.is_set():
+            # Only this thread advances _seq, so the next slot can be picked unlocked
+            slot = self._ring[(self._seq + 1) % self.ring_size] if self._ring is not None else None
+            frame = self.camera.get_frame(slot)
+            if frame is None:
+                consecutive_failures += 1
+                self.logger.warning("Failed to capture frame (%d/%d)", consecutive_failures, self.max_failures)
+                
+                if consecutive_failures >= self.max_failures:
+                    self.logger.error("Too many consecutive frame failures, attempting camera recovery")
+                    if not self.camera.initialize_camera(self.camera_index):
+                        self.logger.error("Camera recovery failed, exiting")
+                        self.lost.set()
+                        with self._frame_ready:
+                            self._frame_ready.notify_all()
+                        return
+                    consecutive_failures = 0
+                    continue
+                
+                # Exponential backoff: 10 ms, 20 ms, ... capped at 1 s
+                self._stop_event.wait(min(0.01 * (2 ** (consecutive_failures - 1)), 1.0))
+                continue
+            
+            consecutive_failures = 0  # Reset on successful frame
+            if self.ring_size and (self._ring is None or self._ring.shape[1:] != frame.shape):
+                self._ring = np.empty((self.ring_size,) + frame.shape, dtype=frame.dtype)
+            self._publish(frame)
+
+
 def test_camera_interface():
     """
     Simple test function to verify camera interface functionality.
@@ -242,4 +850,5 @@ def test_camera_interface():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     test_camera_interface()
\ No newline at end of file
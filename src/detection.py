@@ -4,11 +4,23 @@ Provides real-time detection of key navigation objects: person, chair, car, door
 """
 
 from ultralytics import YOLO
+import cv2
 import numpy as np
 from typing import List, Optional
 import logging
+import math
+import shutil
+import threading
+from pathlib import Path
 from .error_handler import get_error_handler, get_graceful_shutdown
 
+# Try to import numba for the compiled alert scan
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 
 def get_largest_detection(detections: List['Detection']) -> Optional['Detection']:
     """
@@ -26,10 +38,249 @@ def get_largest_detection(detections: List['Detection']) -> Optional['Detection'
     return max(detections, key=lambda d: d.get_area())
 
 
+def _select_alerts_numpy(boxes, class_ids, frame_w, frame_h, last_alert, now, cooldown, ratio):
+    """NumPy implementation of select_alerts."""
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    # The ratio is float64 in the compiled scan; float32 would round across the threshold
+    close = areas.astype(np.float64) / (frame_w * frame_h) > ratio
+    return close & (now - last_alert[class_ids] > cooldown)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _select_alerts_numba(boxes, class_ids, frame_w, frame_h, last_alert, now, cooldown, ratio):
+        """Compiled single-pass version of _select_alerts_numpy."""
+        n = boxes.shape[0]
+        mask = np.zeros(n, dtype=np.bool_)
+        frame_area = frame_w * frame_h
+        for i in range(n):
+            area = (boxes[i, 2] - boxes[i, 0]) * (boxes[i, 3] - boxes[i, 1])
+            if area / frame_area > ratio and now - last_alert[class_ids[i]] > cooldown:
+                mask[i] = True
+        return mask
+
+
+def select_alerts(detections: 'DetectionList', frame_width: int, frame_height: int,
+                  last_alert: np.ndarray, now: float, cooldown: float, ratio: float) -> np.ndarray:
+    """
+    Find detections that are close and whose class is out of its alert cooldown.
+    
+    Args:
+        detections: DetectionList for one frame
+        frame_width: Width of the frame the boxes refer to
+        frame_height: Height of the frame the boxes refer to
+        last_alert: float64 array of last alert times, indexed by class ID
+        now: Current time on the same clock as last_alert
+        cooldown: Minimum seconds between alerts for the same class
+        ratio: Proximity threshold as a fraction of frame area
+        
+    Returns:
+        Boolean mask over detections, True where an alert should be raised
+    """
+    if not detections:
+        return np.zeros(0, dtype=bool)
+    
+    select = _select_alerts_numba if NUMBA_AVAILABLE else _select_alerts_numpy
+    return select(detections.boxes, detections.class_ids, float(frame_width), float(frame_height),
+                  last_alert, float(now), float(cooldown), float(ratio))
+
+
+def warmup_select_alerts():
+    """Trigger JIT compilation of select_alerts so the first frame isn't slowed."""
+    detections = DetectionList([Detection('warmup', 1.0, (0.0, 0.0, 1.0, 1.0), 0)])
+    select_alerts(detections, 1, 1, np.zeros(1, dtype=np.float64), 0.0, 1.0, 0.5)
+
+
+def resize_for_inference(frame: np.ndarray, max_side: int = 640) -> tuple:
+    """
+    Downscale a frame once so every model can share the same input.
+    
+    The aspect ratio is preserved, so the detector's own letterboxing does
+    not need to resize again. Frames already within max_side are returned as-is.
+    
+    Args:
+        frame: Input video frame (BGR format from OpenCV)
+        max_side: Target length of the longest side in pixels
+        
+    Returns:
+        Tuple of (resized_frame, scale) where scale maps resized coordinates
+        back to the original frame (original = resized * scale)
+    """
+    height, width = frame.shape[:2]
+    longest = max(height, width)
+    if longest <= max_side:
+        return frame, 1.0
+    
+    scale = longest / max_side
+    size = (int(round(width / scale)), int(round(height / scale)))
+    return cv2.resize(frame, size, interpolation=cv2.INTER_LINEAR), scale
+
+
+def scale_detections(detections: List['Detection'], scale: float) -> 'DetectionList':
+    """
+    Map detections from a resized frame back to original frame coordinates.
+    
+    Args:
+        detections: List of Detection objects in resized-frame coordinates
+        scale: Scale factor returned by resize_for_inference
+        
+    Returns:
+        DetectionList of new Detection objects in original-frame coordinates
+    """
+    if scale == 1.0:
+        return detections
+    
+    return DetectionList(Detection(d.class_name, d.confidence, tuple(v * scale for v in d.bbox), d.class_id)
+                         for d in detections)
+
+
+class DetectionList(list):
+    """
+    List of Detection objects with struct-of-arrays views for vectorized math.
+    
+    Behaves exactly like a list of Detection objects. The boxes, class_ids and
+    confidences arrays are built from the detector output when available, or
+    lazily from the items otherwise, and rebuilt after any in-place change.
+    """
+    
+    def __init__(self, detections=(), boxes: Optional[np.ndarray] = None,
+                 class_ids: Optional[np.ndarray] = None, confidences: Optional[np.ndarray] = None):
+        """
+        Initialize the list.
+        
+        Args:
+            detections: Iterable of Detection objects
+            boxes: Optional (N, 4) float32 array of (x1, y1, x2, y2) matching detections
+            class_ids: Optional (N,) int32 array of class IDs matching detections
+            confidences: Optional (N,) float32 array of confidences matching detections
+        """
+        super().__init__(detections)
+        self._arrays = None
+        if boxes is not None and class_ids is not None and confidences is not None:
+            self._arrays = (boxes, class_ids, confidences)
+    
+    def _get_arrays(self) -> tuple:
+        """Return (boxes, class_ids, confidences), rebuilding them if stale."""
+        if self._arrays is None:
+            boxes = np.array([d.bbox for d in self], dtype=np.float32).reshape(-1, 4)
+            class_ids = np.array([d.class_id for d in self], dtype=np.int32)
+            confidences = np.array([d.confidence for d in self], dtype=np.float32)
+            self._arrays = (boxes, class_ids, confidences)
+        return self._arrays
+    
+    @property
+    def boxes(self) -> np.ndarray:
+        """(N, 4) float32 array of bounding boxes as (x1, y1, x2, y2)."""
+        return self._get_arrays()[0]
+    
+    @property
+    def class_ids(self) -> np.ndarray:
+        """(N,) int32 array of class IDs."""
+        return self._get_arrays()[1]
+    
+    @property
+    def confidences(self) -> np.ndarray:
+        """(N,) float32 array of confidence scores."""
+        return self._get_arrays()[2]
+    
+    def areas(self) -> np.ndarray:
+        """(N,) float32 array of bounding box areas."""
+        boxes = self.boxes
+        return (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    
+    def close_mask(self, frame_width: int, frame_height: int, threshold: float = 0.15) -> np.ndarray:
+        """
+        Vectorized Detection.is_close over the whole list.
+        
+        Args:
+            frame_width: Width of the video frame
+            frame_height: Height of the video frame
+            threshold: Proximity threshold (default 0.15 = 15% of frame area)
+            
+        Returns:
+            (N,) boolean array, True where the object is considered close
+        """
+        # Divide in float64 as is_close does; a float32 ratio rounds across the threshold
+        return self.areas().astype(np.float64) / (frame_width * frame_height) > threshold
+
+
+def _invalidating(name: str):
+    """Wrap the list mutator name so it drops DetectionList's cached arrays."""
+    method = getattr(list, name)
+    
+    def mutator(self, *args, **kwargs):
+        self._arrays = None
+        return method(self, *args, **kwargs)
+    
+    mutator.__name__ = name
+    mutator.__doc__ = method.__doc__
+    return mutator
+
+
+for _name in ('__setitem__', '__delitem__', '__iadd__', '__imul__', 'append', 'extend',
+              'insert', 'pop', 'remove', 'clear', 'sort', 'reverse'):
+    setattr(DetectionList, _name, _invalidating(_name))
+del _name
+
+
+class FrameChangeGate:
+    """
+    Cheap pixel-difference gate for skipping inference on static scenes.
+    
+    Frames are compared against the last frame that passed the gate on a
+    small grayscale thumbnail, so slow drift still accumulates into a change.
+    """
+    
+    def __init__(self, size: tuple = (160, 120), pixel_threshold: int = 15,
+                 change_ratio: float = 0.01):
+        """
+        Initialize the change gate.
+        
+        Args:
+            size: Thumbnail size (width, height) used for the comparison
+            pixel_threshold: Minimum absolute gray-level difference for a pixel to count as changed
+            change_ratio: Fraction of changed pixels required to report a change (default 1%)
+        """
+        self.size = size
+        self.pixel_threshold = pixel_threshold
+        self.change_ratio = change_ratio
+        self._reference = None
+        self._min_changed = int(size[0] * size[1] * change_ratio)
+    
+    def has_changed(self, frame: np.ndarray) -> bool:
+        """
+        Check whether the frame differs enough from the last accepted frame.
+        
+        Args:
+            frame: Input video frame (BGR format from OpenCV)
+            
+        Returns:
+            True if inference should run on this frame
+        """
+        gray = cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), self.size,
+                          interpolation=cv2.INTER_AREA)
+        
+        if self._reference is None:
+            self._reference = gray
+            return True
+        
+        diff = cv2.absdiff(gray, self._reference)
+        _, mask = cv2.threshold(diff, self.pixel_threshold, 255, cv2.THRESH_BINARY)
+        if cv2.countNonZero(mask) < self._min_changed:
+            return False
+        
+        self._reference = gray
+        return True
+    
+    def reset(self):
+        """Forget the reference frame so the next frame always passes."""
+        self._reference = None
+
+
 class Detection:
     """Represents a single object detection with class, confidence, and bounding box."""
     
-    def __init__(self, class_name: str, confidence: float, bbox: tuple):
+    def __init__(self, class_name: str, confidence: float, bbox: tuple, class_id: int = -1):
         """
         Initialize a detection object.
         
@@ -37,14 +288,17 @@ class Detection:
             class_name: Name of the detected object class
             confidence: Detection confidence score (0.0 to 1.0)
             bbox: Bounding box coordinates as (x1, y1, x2, y2)
+            class_id: Model class ID (COCO index), or -1 if unknown
         """
         self.class_name = class_name
         self.confidence = confidence
         self.bbox = bbox  # (x1, y1, x2, y2)
+        self.class_id = class_id
+        self.area = (bbox[2] - bbox[0]) * (bbox[3] - bbox[1])
     
     def get_area(self) -> float:
-        """Calculate the area of the bounding box."""
-        return (self.bbox[2] - self.bbox[0]) * (self.bbox[3] - self.bbox[1])
+        """Return the area of the bounding box (computed once at construction)."""
+        return self.area
     
     def is_close(self, frame_width: int, frame_height: int, threshold: float = 0.15) -> bool:
         """
@@ -74,16 +328,29 @@ class ObjectDetector:
         # For now, we'll focus on the 3 available COCO classes
     }
     
-    def __init__(self, confidence_threshold: float = 0.5, model_name: str = 'yolov8n.pt'):
+    def __init__(self, confidence_threshold: float = 0.5, model_name: str = 'yolov8n.pt',
+                 device: Optional[str] = None, backend: str = 'pytorch',
+                 engine_cache_dir: Optional[str] = None,
+                 precision: str = 'auto', warmup_iterations: int = 3):
         """
         Initialize the object detector with comprehensive error handling.
         
         Args:
             confidence_threshold: Minimum confidence score for detections (default 0.5)
             model_name: YOLOv8 model variant to use (default 'yolov8n.pt' for nano)
+            device: Inference device ('cpu', 'cuda', 'cuda:0', ...). Auto-selects
+                CUDA when available if None.
+            backend: 'pytorch' (default) or 'openvino'. OpenVINO is CPU-only and
+                falls back to PyTorch if export or loading fails.
+            engine_cache_dir: Directory for exported engines, reused across runs
+                so the export cost is only paid once (default 'models/engine_cache')
+            precision: 'auto' (FP16 on CUDA, FP32 on CPU), 'fp32', 'fp16' or 'int8'.
+                INT8 is CPU-only and uses a quantized OpenVINO export.
+            warmup_iterations: Dummy inference passes run after loading so the
+                first real frame does not pay for autotuning (0 disables)
         
         Raises:
-            ValueError: If confidence_threshold is not between 0 and 1
+            ValueError: If confidence_threshold is not between 0 and 1, or precision is unknown
         """
         # Validate confidence threshold
         if not 0.0 <= confidence_threshold <= 1.0:
@@ -94,12 +361,34 @@ class ObjectDetector:
         self.model = None
         self.logger = logging.getLogger(__name__)
         
+        if precision not in ('auto', 'fp32', 'fp16', 'int8'):
+            raise ValueError(f"precision must be 'auto', 'fp32', 'fp16' or 'int8', got {precision}")
+        
+        self.device = device or self._select_device()
+        on_cuda = self.device.startswith('cuda')
+        self.int8 = precision == 'int8' and not on_cuda
+        self.half = on_cuda and precision in ('auto', 'fp16')
+        self._predict_args = {'verbose': False, 'device': self.device, 'half': self.half}
+        
+        # INT8 weights are produced by the OpenVINO exporter, so it implies that backend
+        self.backend = 'openvino' if self.int8 else backend
+        self.engine_cache_dir = Path(engine_cache_dir or 'models/engine_cache')
+        
         error_handler = get_error_handler()
         
         try:
             # Initialize YOLOv8n model - will download if not present
-            self.model = YOLO(model_name)
-            self.logger.info(f"YOLOv8 model {model_name} loaded successfully")
+            self.model = None
+            if self.backend == 'openvino' and self.device == 'cpu':
+                self.model = self._load_openvino_model(model_name)
+            if self.model is None:
+                self.backend = 'pytorch'
+                self.int8 = False
+                self.model = YOLO(model_name)
+                if self.device != 'cpu':
+                    self.model.to(self.device)
+            self.logger.info(f"YOLOv8 model {model_name} loaded successfully on {self.device}"
+                             f"{' (FP16)' if self.half else ' (INT8)' if self.int8 else ''}")
             
             # Register cleanup with shutdown handler
             shutdown_handler = get_graceful_shutdown()
@@ -119,6 +408,80 @@ class ObjectDetector:
                     raise RuntimeError(f"Could not initialize YOLOv8 model: {e}")
             else:
                 raise RuntimeError(f"Could not initialize YOLOv8 model: {e}")
+        
+        if warmup_iterations > 0:
+            self.warmup(warmup_iterations)
+    
+    def _load_openvino_model(self, model_name: str):
+        """
+        Load an OpenVINO IR export of the model, exporting it on first use.
+        
+        The IR is kept in engine_cache_dir so later runs skip the export. With
+        INT8 enabled the exporter quantizes the weights (post-training, via NNCF)
+        and the result is cached separately from the FP32 IR.
+        
+        Args:
+            model_name: YOLOv8 weights file the export is derived from
+            
+        Returns:
+            YOLO model backed by OpenVINO, or None if export/loading failed
+        """
+        suffix = '_int8' if self.int8 else ''
+        ir_dir = self.engine_cache_dir / f"{Path(model_name).stem}{suffix}_openvino_model"
+        try:
+            if not ir_dir.exists():
+                self.logger.info(f"Exporting {model_name} to OpenVINO{' INT8' if self.int8 else ''} (one-time)...")
+                exported = YOLO(model_name).export(format='openvino', int8=self.int8, verbose=False)
+                self.engine_cache_dir.mkdir(parents=True, exist_ok=True)
+                shutil.move(str(exported), str(ir_dir))
+            
+            model = YOLO(str(ir_dir), task='detect')
+            self.logger.info(f"Loaded cached OpenVINO engine from {ir_dir}")
+            return model
+        except Exception as e:
+            self.logger.warning(f"OpenVINO engine unavailable, using PyTorch: {e}")
+            return None
+    
+    @staticmethod
+    def _select_device() -> str:
+        """Pick CUDA when a GPU is available, otherwise fall back to CPU."""
+        try:
+            import torch
+            if torch.cuda.is_available():
+                return 'cuda:0'
+        except ImportError:
+            pass
+        return 'cpu'
+    
+    def warmup(self, iterations: int = 3, frame_shape: tuple = (480, 640, 3)):
+        """
+        Run dummy inference passes to absorb one-time initialization costs.
+        
+        The first forward pass pays for lazy model fusing, backend autotuning and
+        kernel compilation; doing it up front keeps the first real frame fast.
+        
+        Args:
+            iterations: Number of warm-up passes (default 3)
+            frame_shape: Shape of the dummy frame (default 480x640 BGR)
+        """
+        if self.model is None:
+            return
+        
+        dummy = np.zeros(frame_shape, dtype=np.uint8)
+        try:
+            for _ in range(iterations):
+                self.model(dummy, **self._predict_args)
+            self.logger.debug(f"Detector warmed up with {iterations} passes")
+        except Exception as e:
+            self.logger.warning(f"Detector warm-up failed: {e}")
+    
+    @property
+    def num_classes(self) -> int:
+        """Number of class IDs the model can emit (size for per-class lookup tables)."""
+        names = getattr(self.model, 'names', None)
+        if names:
+            return max(len(names), max(self.TARGET_CLASSES) + 1)
+        return max(self.TARGET_CLASSES) + 1
     
     def _cleanup(self):
         """Cleanup model resources."""
@@ -130,7 +493,7 @@ class ObjectDetector:
         except Exception as e:
             self.logger.error(f"Error during object detector cleanup: {e}")
     
-    def detect(self, frame: np.ndarray) -> List[Detection]:
+    def detect(self, frame: np.ndarray) -> 'DetectionList':
         """
         Detect objects in the given frame with comprehensive error handling.
         
@@ -142,39 +505,20 @@ class ObjectDetector:
         """
         if self.model is None:
             self.logger.warning("Model not initialized, returning empty detection list")
-            return []
+            return DetectionList()
         
         if frame is None or frame.size == 0:
             self.logger.warning("Invalid frame provided, returning empty detection list")
-            return []
+            return DetectionList()
         
         error_handler = get_error_handler()
         
         try:
             # Run YOLOv8 inference on the frame
-            results = self.model(frame, verbose=False)
-            
-            detections = []
+            results = self.model(frame, **self._predict_args)
             
             # Process results from the first (and only) image
-            if len(results) > 0:
-                result = results[0]
-                
-                # Extract boxes, confidences, and class IDs
-                if result.boxes is not None:
-                    boxes = result.boxes.xyxy.cpu().numpy()  # Bounding boxes in xyxy format
-                    confidences = result.boxes.conf.cpu().numpy()  # Confidence scores
-                    class_ids = result.boxes.cls.cpu().numpy().astype(int)  # Class IDs
-                    
-                    # Filter detections for target classes and confidence threshold
-                    for i, (box, conf, class_id) in enumerate(zip(boxes, confidences, class_ids)):
-                        # Check if this is a target class and meets confidence threshold
-                        if class_id in self.TARGET_CLASSES and conf >= self.confidence_threshold:
-                            class_name = self.TARGET_CLASSES[class_id]
-                            bbox = tuple(box)  # Convert to (x1, y1, x2, y2) tuple
-                            
-                            detection = Detection(class_name, float(conf), bbox)
-                            detections.append(detection)
+            detections = self._parse_result(results[0]) if len(results) > 0 else DetectionList()
             
             self.logger.debug(f"Detected {len(detections)} objects above threshold")
             return detections
@@ -184,12 +528,171 @@ class ObjectDetector:
             self.logger.error(f"Model runtime error during detection: {e}")
             context = {"model_name": self.model_name, "frame_shape": frame.shape if frame is not None else None}
             error_handler.handle_error("model_error", e, context)
-            return []
+            return DetectionList()
         except Exception as e:
             self.logger.error(f"Error during object detection: {e}")
             context = {"model_name": self.model_name, "frame_shape": frame.shape if frame is not None else None}
             error_handler.handle_error("general_error", e, context)
+            return DetectionList()
+    
+    def detect_batch(self, frames: List[np.ndarray]) -> List['DetectionList']:
+        """
+        Detect objects in several frames with a single batched forward pass.
+        
+        Amortizes per-call inference overhead across the batch, which mostly
+        pays off on GPU backends.
+        
+        Args:
+            frames: List of input frames (BGR format from OpenCV)
+            
+        Returns:
+            List of detection lists, one per input frame and in the same order
+        """
+        if not frames:
             return []
+        
+        if self.model is None:
+            self.logger.warning("Model not initialized, returning empty detection lists")
+            return [DetectionList() for _ in frames]
+        
+        # Only valid frames go through the model; invalid ones get empty results
+        valid_indices = [i for i, f in enumerate(frames) if f is not None and f.size > 0]
+        batch_results: List[DetectionList] = [DetectionList() for _ in frames]
+        if not valid_indices:
+            self.logger.warning("No valid frames provided, returning empty detection lists")
+            return batch_results
+        
+        error_handler = get_error_handler()
+        
+        try:
+            results = self.model([frames[i] for i in valid_indices], **self._predict_args)
+            
+            for i, result in zip(valid_indices, results):
+                batch_results[i] = self._parse_result(result)
+            
+            self.logger.debug(f"Batched detection on {len(valid_indices)} frames")
+            return batch_results
+            
+        except RuntimeError as e:
+            self.logger.error(f"Model runtime error during batched detection: {e}")
+            context = {"model_name": self.model_name, "batch_size": len(valid_indices)}
+            error_handler.handle_error("model_error", e, context)
+            return [DetectionList() for _ in frames]
+        except Exception as e:
+            self.logger.error(f"Error during batched object detection: {e}")
+            context = {"model_name": self.model_name, "batch_size": len(valid_indices)}
+            error_handler.handle_error("general_error", e, context)
+            return [DetectionList() for _ in frames]
+    
+    def detect_mosaic(self, frames: List[np.ndarray], canvas_size: int = 640) -> List['DetectionList']:
+        """
+        Detect objects in several frames by packing them into one canvas.
+        
+        Frames are tiled on a square grid inside a single canvas_size canvas and
+        run through one forward pass at the model's native input size. Each
+        detection is assigned to the tile containing its centre, clipped to that
+        tile and mapped back to the source frame's coordinates. Small objects
+        lose resolution in the process, so this is opt-in.
+        
+        Args:
+            frames: List of input frames (BGR format from OpenCV)
+            canvas_size: Side length of the square canvas in pixels (default 640)
+            
+        Returns:
+            List of detection lists, one per input frame and in the same order
+        """
+        if not frames:
+            return []
+        
+        mosaic_results: List[DetectionList] = [DetectionList() for _ in frames]
+        if self.model is None:
+            self.logger.warning("Model not initialized, returning empty detection lists")
+            return mosaic_results
+        
+        grid = math.ceil(math.sqrt(len(frames)))
+        tile = canvas_size // grid
+        canvas = np.zeros((canvas_size, canvas_size, 3), dtype=np.uint8)
+        
+        # (x_offset, y_offset, placed_width, placed_height, scale) per tile
+        placements = []
+        for index, frame in enumerate(frames):
+            if frame is None or frame.size == 0:
+                placements.append(None)
+                continue
+            
+            height, width = frame.shape[:2]
+            scale = min(tile / width, tile / height)
+            placed_w, placed_h = max(1, int(width * scale)), max(1, int(height * scale))
+            x_off, y_off = (index % grid) * tile, (index // grid) * tile
+            canvas[y_off:y_off + placed_h, x_off:x_off + placed_w] = cv2.resize(
+                frame, (placed_w, placed_h), interpolation=cv2.INTER_AREA)
+            placements.append((x_off, y_off, placed_w, placed_h, scale))
+        
+        error_handler = get_error_handler()
+        
+        try:
+            results = self.model(canvas, **self._predict_args)
+            detections = self._parse_result(results[0]) if len(results) > 0 else []
+            
+            for detection in detections:
+                x1, y1, x2, y2 = detection.bbox
+                col = min(int((x1 + x2) / 2) // tile, grid - 1)
+                row = min(int((y1 + y2) / 2) // tile, grid - 1)
+                index = row * grid + col
+                if index >= len(frames) or placements[index] is None:
+                    continue
+                
+                x_off, y_off, placed_w, placed_h, scale = placements[index]
+                bx1 = min(max(x1 - x_off, 0), placed_w) / scale
+                by1 = min(max(y1 - y_off, 0), placed_h) / scale
+                bx2 = min(max(x2 - x_off, 0), placed_w) / scale
+                by2 = min(max(y2 - y_off, 0), placed_h) / scale
+                if bx2 > bx1 and by2 > by1:
+                    mosaic_results[index].append(
+                        Detection(detection.class_name, detection.confidence, (bx1, by1, bx2, by2),
+                                  detection.class_id))
+            
+            self.logger.debug(f"Mosaic detection on {len(frames)} frames in a {grid}x{grid} grid")
+            return mosaic_results
+            
+        except RuntimeError as e:
+            self.logger.error(f"Model runtime error during mosaic detection: {e}")
+            context = {"model_name": self.model_name, "batch_size": len(frames)}
+            error_handler.handle_error("model_error", e, context)
+            return [DetectionList() for _ in frames]
+        except Exception as e:
+            self.logger.error(f"Error during mosaic object detection: {e}")
+            context = {"model_name": self.model_name, "batch_size": len(frames)}
+            error_handler.handle_error("general_error", e, context)
+            return [DetectionList() for _ in frames]
+    
+    def _parse_result(self, result) -> 'DetectionList':
+        """
+        Convert a single YOLOv8 result into Detection objects.
+        
+        Args:
+            result: Ultralytics result for one image
+            
+        Returns:
+            DetectionList for target classes above confidence threshold
+        """
+        if result.boxes is None:
+            return DetectionList()
+        
+        # Extract boxes, confidences, and class IDs
+        boxes = result.boxes.xyxy.cpu().numpy().astype(np.float32)  # Bounding boxes in xyxy format
+        confidences = result.boxes.conf.cpu().numpy().astype(np.float32)  # Confidence scores
+        class_ids = result.boxes.cls.cpu().numpy().astype(np.int32)  # Class IDs
+        
+        # Filter detections for target classes and confidence threshold in one pass
+        keep = np.isin(class_ids, list(self.TARGET_CLASSES)) & (confidences >= self.confidence_threshold)
+        boxes, confidences, class_ids = boxes[keep], confidences[keep], class_ids[keep]
+        
+        detections = [
+            Detection(self.TARGET_CLASSES[int(class_id)], float(conf), tuple(box), int(class_id))
+            for box, conf, class_id in zip(boxes, confidences, class_ids)
+        ]
+        return DetectionList(detections, boxes=boxes, class_ids=class_ids, confidences=confidences)
     
     def get_largest_detection(self, detections: List[Detection]) -> Optional[Detection]:
         """
@@ -219,4 +722,28 @@ class ObjectDetector:
         Returns:
             List of detections considered to be in close proximity
         """
-        return [d for d in detections if d.is_close(frame_width, frame_height)]
\ No newline at end of file
+        return [d for d in detections if d.is_close(frame_width, frame_height)]
+
+
+_detector: Optional[ObjectDetector] = None
+_detector_lock = threading.Lock()
+
+
+def get_or_create_detector(**kwargs) -> ObjectDetector:
+    """
+    Get the process-wide detector, creating (and warming up) it on first use.
+    
+    Later calls return the same instance and ignore their arguments, so the
+    model is loaded and warmed up only once per process.
+    
+    Args:
+        **kwargs: ObjectDetector constructor arguments used on first creation
+        
+    Returns:
+        The shared ObjectDetector instance
+    """
+    global _detector
+    with _detector_lock:
+        if _detector is None:
+            _detector = ObjectDetector(**kwargs)
+        return _detector
@@ -0,0 +1,184 @@
+"""
+Display helpers for VisionMate-Lite overlays.
+
+Batches per-detection drawing so a frame's boxes are stamped in a single call
+instead of one OpenCV call per detection.
+"""
+
+import cv2
+import numpy as np
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Try to import numba for the compiled drawing kernel
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Reported on first use rather than at import, before the app configures logging
+_fallback_logged = False
+
+
+CLOSE_COLOR = (0, 255, 0)   # BGR green for objects in close proximity
+FAR_COLOR = (255, 0, 0)     # BGR blue for everything else
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _draw_rects_kernel(img, bboxes, colors, thickness):
+        """Stamp rectangle outlines into img, one box per parallel iteration."""
+        height, width = img.shape[0], img.shape[1]
+        for i in prange(bboxes.shape[0]):
+            x1 = min(max(bboxes[i, 0], 0), width - 1)
+            y1 = min(max(bboxes[i, 1], 0), height - 1)
+            x2 = min(max(bboxes[i, 2], 0), width - 1)
+            y2 = min(max(bboxes[i, 3], 0), height - 1)
+            if x2 < x1 or y2 < y1:
+                continue
+            t = min(thickness, x2 - x1 + 1, y2 - y1 + 1)
+            for c in range(3):
+                img[y1:y1 + t, x1:x2 + 1, c] = colors[i, c]
+                img[y2 - t + 1:y2 + 1, x1:x2 + 1, c] = colors[i, c]
+                img[y1:y2 + 1, x1:x1 + t, c] = colors[i, c]
+                img[y1:y2 + 1, x2 - t + 1:x2 + 1, c] = colors[i, c]
+
+
+def draw_detection_boxes(img: np.ndarray, detections: List, close_flags: Sequence[bool],
+                         thickness: int = 2) -> np.ndarray:
+    """
+    Draw bounding boxes for all detections onto a BGR image in place.
+
+    Args:
+        img: Display image (BGR, uint8) to draw on
+        detections: List of Detection objects
+        close_flags: Per-detection proximity flags selecting the box color
+        thickness: Outline thickness in pixels (default 2)
+
+    Returns:
+        The same image, for chaining
+    """
+    if not detections:
+        return img
+
+    bboxes = np.array([d.bbox for d in detections], dtype=np.float32).astype(np.int32)
+    colors = np.where(np.asarray(close_flags, dtype=bool)[:, None],
+                      np.array(CLOSE_COLOR, dtype=np.uint8),
+                      np.array(FAR_COLOR, dtype=np.uint8))
+
+    if NUMBA_AVAILABLE and img.dtype == np.uint8 and img.ndim == 3:
+        _draw_rects_kernel(img, bboxes, colors, thickness)
+    else:
+        global _fallback_logged
+        if not NUMBA_AVAILABLE and not _fallback_logged:
+            _fallback_logged = True
+            logger.info("Numba not available. Falling back to OpenCV for box drawing.")
+        for (x1, y1, x2, y2), color in zip(bboxes, colors):
+            cv2.rectangle(img, (int(x1), int(y1)), (int(x2), int(y2)), tuple(int(c) for c in color), thickness)
+
+    return img
+
+
+class StaticTextLayer:
+    """
+    Text overlay rasterized once and blitted onto every frame.
+
+    Hershey text rendering is comparatively expensive, so strings that never
+    change are drawn into a BGRA layer the first time a frame size is seen and
+    copied through their alpha mask afterwards.
+    """
+
+    def __init__(self, items: List[Tuple[str, Tuple[int, int], float, Tuple[int, int, int], int]]):
+        """
+        Initialize the layer.
+
+        Args:
+            items: List of (text, (x, y), font_scale, color, thickness) tuples.
+                A negative y is measured from the bottom edge of the frame.
+        """
+        self.items = items
+        self._layer = None
+        self._mask = None
+
+    def _render(self, shape: tuple):
+        """Rasterize all items for the given frame shape."""
+        height, width = shape[:2]
+        layer = np.zeros((height, width, 4), dtype=np.uint8)
+        for text, (x, y), font_scale, color, thickness in self.items:
+            org = (x, y if y >= 0 else height + y)
+            cv2.putText(layer, text, org, cv2.FONT_HERSHEY_SIMPLEX, font_scale,
+                        (*color, 255), thickness)
+        self._layer = np.ascontiguousarray(layer[..., :3])
+        self._mask = layer[..., 3:] > 0
+
+    def apply(self, img: np.ndarray) -> np.ndarray:
+        """
+        Blit the cached text onto a BGR image in place.
+
+        Args:
+            img: Display image (BGR, uint8) to draw on
+
+        Returns:
+            The same image, for chaining
+        """
+        if self._layer is None or self._layer.shape[:2] != img.shape[:2]:
+            self._render(img.shape)
+        np.copyto(img, self._layer, where=self._mask)
+        return img
+
+
+@lru_cache(maxsize=64)
+def _text_mask(text: str, font_scale: float, thickness: int) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """
+    Rasterize a string into a tight boolean mask (memoized per string and style).
+
+    Returns:
+        Tuple of (mask, (ox, oy)) where (ox, oy) is the text origin inside the mask
+    """
+    (width, height), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)
+    pad = thickness
+    canvas = np.zeros((height + baseline + 2 * pad, width + 2 * pad), dtype=np.uint8)
+    origin = (pad, height + pad)
+    cv2.putText(canvas, text, origin, cv2.FONT_HERSHEY_SIMPLEX, font_scale, 255, thickness)
+    mask = canvas > 0
+    mask.flags.writeable = False
+    return mask, origin
+
+
+def draw_text(img: np.ndarray, text: str, org: Tuple[int, int], font_scale: float,
+              color: Tuple[int, int, int], thickness: int = 1) -> np.ndarray:
+    """
+    Draw text like cv2.putText, reusing a cached rasterization of the string.
+
+    Overlay strings such as status messages repeat for many frames, so only
+    their first appearance pays for Hershey rendering; afterwards the cached
+    mask is stamped into the text's bounding box.
+
+    Args:
+        img: Display image (BGR, uint8) to draw on
+        text: String to draw
+        org: Bottom-left corner of the text baseline, as for cv2.putText
+        font_scale: Font scale
+        color: BGR color
+        thickness: Stroke thickness in pixels (default 1)
+
+    Returns:
+        The same image, for chaining
+    """
+    mask, (ox, oy) = _text_mask(text, font_scale, thickness)
+    x0, y0 = org[0] - ox, org[1] - oy
+    x1, y1 = x0 + mask.shape[1], y0 + mask.shape[0]
+
+    # Clip the stamp to the image
+    cx0, cy0 = max(x0, 0), max(y0, 0)
+    cx1, cy1 = min(x1, img.shape[1]), min(y1, img.shape[0])
+    if cx0 >= cx1 or cy0 >= cy1:
+        return img
+
+    region = img[cy0:cy1, cx0:cx1]
+    region[mask[cy0 - y0:cy1 - y0, cx0 - x0:cx1 - x0]] = color
+    return img
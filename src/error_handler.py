@@ -13,6 +13,7 @@ import atexit
 from typing import Optional, Dict, Any, Callable, List
 from pathlib import Path
 import threading
+import queue
 import time
 
 
@@ -567,6 +568,13 @@ class PrivacyManager:
         self.debug_mode = False
         self.saved_frames_dir = Path("debug_frames")
         
+        # Frames are encoded and written on a background thread so disk I/O never
+        # stalls the caller; the queue drops the oldest pending frame when full
+        self.min_save_interval = 0.5  # Seconds between accepted saves
+        self._save_queue = queue.Queue(maxsize=4)
+        self._writer_thread: Optional[threading.Thread] = None
+        self._last_save_time = 0.0
+        
         # Load settings from environment
         self._load_privacy_settings()
     
@@ -580,6 +588,10 @@ class PrivacyManager:
         debug_mode = os.getenv('DEBUG_MODE', 'false').lower()
         self.debug_mode = debug_mode in ['true', '1', 'yes']
         
+        # Debug frame encoding: JPEG quality and optional grayscale-only policy
+        self.debug_frame_quality = int(os.getenv('DEBUG_FRAME_QUALITY', '70'))
+        self.debug_frame_grayscale = os.getenv('DEBUG_FRAME_GRAYSCALE', 'false').lower() in ['true', '1', 'yes']
+        
         if self.frame_logging_enabled:
             self.logger.warning("Frame logging is ENABLED - frames will be saved to disk")
             self.saved_frames_dir.mkdir(exist_ok=True)
@@ -594,6 +606,9 @@ class PrivacyManager:
         """
         Save a frame for debugging purposes (only if enabled).
         
+        The frame is copied and queued for the writer thread. Saves closer
+        together than min_save_interval are dropped.
+        
         Args:
             frame: Image frame to save
             filename: Optional filename, auto-generated if not provided
@@ -601,19 +616,50 @@ class PrivacyManager:
         if not self.can_save_frame():
             return
         
-        try:
+        now = time.time()
+        if now - self._last_save_time < self.min_save_interval:
+            return
+        self._last_save_time = now
+        
+        if filename is None:
+            filename = f"debug_frame_{int(now * 1000)}.jpg"
+        
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._drain_saves, name="debug-frame-writer", daemon=True)
+            self._writer_thread.start()
+        
+        # Grayscale conversion doubles as the copy handed to the writer thread
+        if self.debug_frame_grayscale and getattr(frame, 'ndim', 0) == 3:
             import cv2
-            
-            if filename is None:
-                timestamp = int(time.time() * 1000)
-                filename = f"debug_frame_{timestamp}.jpg"
-            
-            filepath = self.saved_frames_dir / filename
-            cv2.imwrite(str(filepath), frame)
-            self.logger.debug(f"Debug frame saved: {filepath}")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to save debug frame: {e}")
+            item = (cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), filename)
+        else:
+            item = (frame.copy(), filename)
+        while True:
+            try:
+                self._save_queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._save_queue.get_nowait()
+                except queue.Empty:
+                    pass
+    
+    def _drain_saves(self):
+        """Write queued debug frames to disk (runs on the writer thread)."""
+        import cv2
+        
+        encode_params = [cv2.IMWRITE_JPEG_QUALITY, self.debug_frame_quality]
+        while True:
+            frame, filename = self._save_queue.get()
+            try:
+                filepath = self.saved_frames_dir / filename
+                ok, buf = cv2.imencode('.jpg', frame, encode_params)
+                if not ok:
+                    raise RuntimeError("JPEG encoding failed")
+                buf.tofile(str(filepath))
+                self.logger.debug(f"Debug frame saved: {filepath}")
+            except Exception as e:
+                self.logger.error(f"Failed to save debug frame: {e}")
     
     def clear_saved_frames(self):
         """Clear all saved debug frames."""
@@ -630,6 +676,7 @@ class PrivacyManager:
         return {
             "frame_logging_enabled": self.frame_logging_enabled,
             "debug_mode": self.debug_mode,
+            "debug_frame_grayscale": self.debug_frame_grayscale,
             "saved_frames_dir": str(self.saved_frames_dir),
             "saved_frames_count": len(list(self.saved_frames_dir.glob("*.jpg"))) if self.saved_frames_dir.exists() else 0
         }
@@ -4,12 +4,31 @@ Provides non-blocking keyboard input handling for OCR triggering and other user
 """
 
 import cv2
+import os
+import sys
 import threading
 import time
 import logging
 from typing import Callable, Optional
 from queue import Queue, Empty
 
+# Terminal key input for headless runs: termios puts a POSIX tty in cbreak
+# mode so single key presses arrive without Enter; msvcrt reads the Windows
+# console directly
+try:
+    import select
+    import termios
+    import tty
+    TERMIOS_AVAILABLE = True
+except ImportError:
+    TERMIOS_AVAILABLE = False
+
+try:
+    import msvcrt
+    MSVCRT_AVAILABLE = True
+except ImportError:
+    MSVCRT_AVAILABLE = False
+
 
 class KeyboardHandler:
     """
@@ -207,6 +226,97 @@ class SimpleKeyboardHandler:
             'esc': 27,
             'q': ord('q')
         }
+        
+        # Terminal reader state (headless mode, where there is no window to
+        # deliver waitKey events)
+        self._terminal_keys: Queue = Queue()
+        self._terminal_stop = threading.Event()
+        self._terminal_thread: Optional[threading.Thread] = None
+        self._saved_tty = None
+    
+    def start_terminal_input(self) -> bool:
+        """
+        Start reading key presses from the terminal on a background thread.
+        
+        Returns:
+            True if terminal input is available, False otherwise
+        """
+        if self._terminal_thread is not None:
+            return True
+        
+        if MSVCRT_AVAILABLE:
+            target = self._console_loop
+        elif TERMIOS_AVAILABLE:
+            try:
+                fd = sys.stdin.fileno()
+            except (AttributeError, ValueError, OSError):
+                self.logger.warning("No terminal attached; keyboard input unavailable")
+                return False
+            if os.isatty(fd):
+                self._saved_tty = termios.tcgetattr(fd)
+                tty.setcbreak(fd)  # Keys without Enter; Ctrl+C still raises SIGINT
+            target = self._terminal_loop
+        else:
+            self.logger.warning("Terminal keyboard input not supported on this platform")
+            return False
+        
+        self._terminal_stop.clear()
+        self._terminal_thread = threading.Thread(target=target, name="terminal-input", daemon=True)
+        self._terminal_thread.start()
+        return True
+    
+    def stop_terminal_input(self) -> None:
+        """Stop the terminal reader and restore the terminal mode."""
+        if self._terminal_thread is None:
+            return
+        
+        self._terminal_stop.set()
+        self._terminal_thread.join(timeout=1.0)
+        self._terminal_thread = None
+        if self._saved_tty is not None:
+            termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, self._saved_tty)
+            self._saved_tty = None
+    
+    def _terminal_loop(self) -> None:
+        """Queue bytes from stdin (tty or pipe) until stopped or EOF."""
+        fd = sys.stdin.fileno()
+        while not self._terminal_stop.is_set():
+            try:
+                ready, _, _ = select.select([fd], [], [], 0.1)
+                if not ready:
+                    continue
+                data = os.read(fd, 1)
+            except OSError as e:
+                self.logger.error(f"Error reading terminal input: {e}")
+                return
+            if not data:
+                self.logger.info("Terminal input closed")
+                return
+            self._terminal_keys.put(data[0])
+    
+    def _console_loop(self) -> None:
+        """Queue key presses from the Windows console until stopped."""
+        while not self._terminal_stop.is_set():
+            if msvcrt.kbhit():
+                self._terminal_keys.put(ord(msvcrt.getwch()))
+            else:
+                self._terminal_stop.wait(0.05)
+    
+    def poll_terminal(self) -> Optional[str]:
+        """
+        Return the action for the next key read from the terminal, if any.
+        
+        Returns:
+            Action string if a recognized key was pressed, None otherwise
+        """
+        while True:
+            try:
+                key = self._terminal_keys.get_nowait()
+            except Empty:
+                return None
+            action = self.translate_key(key)
+            if action is not None:
+                return action
     
     def check_input(self, timeout_ms: int = 1) -> Optional[str]:
         """
@@ -219,27 +329,41 @@ class SimpleKeyboardHandler:
             Action string if recognized key pressed, None otherwise
         """
         try:
-            key = cv2.waitKey(timeout_ms) & 0xFF
-            
-            if key == 255:  # No key pressed
-                return None
-            
-            # Check for recognized keys
-            if key == self.key_map.get(self.ocr_trigger_key, 32):
-                self.logger.info("OCR trigger detected")
-                return 'ocr_trigger'
-            elif key == self.key_map.get('esc', 27) or key == ord('q'):
-                self.logger.info("Quit signal detected")
-                return 'quit'
-            else:
-                # Log other keys for debugging
-                if key < 128:
-                    self.logger.debug(f"Unhandled key: {chr(key)}")
-                return None
-                
+            # Single waitKey call: polls the key and pumps the HighGUI window
+            return self.translate_key(cv2.waitKey(timeout_ms))
         except Exception as e:
             self.logger.error(f"Error checking input: {e}")
             return None
+    
+    def translate_key(self, key: int) -> Optional[str]:
+        """
+        Map a raw waitKey/pollKey code to an action.
+        
+        Lets callers that already pump the window with their own waitKey call
+        reuse the key mapping without a second wait.
+        
+        Args:
+            key: Key code as returned by cv2.waitKey (-1 if none)
+            
+        Returns:
+            Action string if recognized key pressed, None otherwise
+        """
+        key &= 0xFF
+        if key == 255:  # No key pressed
+            return None
+        
+        # Check for recognized keys
+        if key == self.key_map.get(self.ocr_trigger_key, 32):
+            self.logger.info("OCR trigger detected")
+            return 'ocr_trigger'
+        elif key in (self.key_map.get('esc', 27), ord('q'), ord('Q')):
+            self.logger.info("Quit signal detected")
+            return 'quit'
+        else:
+            # Log other keys for debugging
+            if key < 128:
+                self.logger.debug(f"Unhandled key: {chr(key)}")
+            return None
 
 
 # Utility functions
@@ -7,7 +7,8 @@ import threading
 import time
 import logging
 import numpy as np
-from typing import Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Callable, List
 from queue import Queue, Empty
 
 from .ocr import OCREngine
@@ -18,6 +19,9 @@ class OCRProcessor:
     """
     Handles asynchronous OCR processing with audio feedback.
     Processes OCR requests in a separate thread to avoid blocking the main detection loop.
+    
+    Frames triggered within a short window of each other are coalesced into
+    one batch whose Tesseract runs overlap, and the most complete read is spoken.
     """
     
     def __init__(self, ocr_engine: OCREngine, audio_manager: AudioManager):
@@ -45,12 +49,25 @@ class OCRProcessor:
         self.is_processing = False
         self.last_processing_time = 0
         
-        # Import config for cooldown setting
+        # Import config for cooldown and batching settings
         try:
             import config
             self.processing_cooldown = config.OCR_PROCESSING_COOLDOWN
+            self.batch_size = config.OCR_BATCH_SIZE
+            self.max_wait_time = config.OCR_BATCH_MAX_WAIT
         except:
             self.processing_cooldown = 2.0  # Fallback default
+            self.batch_size = 3
+            self.max_wait_time = 0.15
+        
+        # The collector opens a batch when it takes the first frame and closes it
+        # when collection ends; while open, up to batch_size - 1 frames join it
+        # without the cooldown checks
+        self._batch_lock = threading.Lock()
+        self._batch_open = False
+        self._batch_joins = 0
+        # Tesseract runs as a subprocess, so threads overlap its work
+        self._ocr_pool: Optional[ThreadPoolExecutor] = None
     
     def start_processor(self) -> None:
         """Start the OCR processing thread."""
@@ -59,6 +76,8 @@ class OCRProcessor:
             return
         
         self.is_running = True
+        if self.batch_size > 1:
+            self._ocr_pool = ThreadPoolExecutor(max_workers=self.batch_size, thread_name_prefix="ocr")
         self.processor_thread = threading.Thread(target=self._processing_loop, daemon=True)
         self.processor_thread.start()
         self.logger.info("OCR processor started")
@@ -68,6 +87,9 @@ class OCRProcessor:
         self.is_running = False
         if self.processor_thread and self.processor_thread.is_alive():
             self.processor_thread.join(timeout=2.0)
+        if self._ocr_pool is not None:
+            self._ocr_pool.shutdown(wait=False)
+            self._ocr_pool = None
         self.logger.info("OCR processor stopped")
     
     def process_frame(self, frame: np.ndarray) -> bool:
@@ -84,8 +106,22 @@ class OCRProcessor:
             self.logger.warning("OCR processor not running")
             return False
         
-        # Check cooldown period
         current_time = time.time()
+        
+        with self._batch_lock:
+            # Joining frames are queued under the lock, so the collector finds
+            # every frame it admitted when it closes the batch
+            if self._batch_open and self._batch_joins < self.batch_size - 1:
+                try:
+                    self.processing_queue.put_nowait(frame.copy())
+                except Exception as e:
+                    self.logger.error(f"Failed to queue frame for OCR: {e}")
+                    return False
+                self._batch_joins += 1
+                self.logger.info("Frame joined the OCR batch being collected")
+                return True
+        
+        # Check cooldown period
         if current_time - self.last_processing_time < self.processing_cooldown:
             self.logger.info(f"OCR request ignored - cooldown period ({self.processing_cooldown}s)")
             return False
@@ -110,19 +146,76 @@ class OCRProcessor:
         """Main OCR processing loop running in separate thread."""
         while self.is_running:
             try:
-                # Wait for frame to process
-                try:
-                    frame = self.processing_queue.get(timeout=1.0)
-                except Empty:
+                # Wait for frames to process
+                batch = self._collect_batch()
+                if not batch:
                     continue
                 
-                # Process the frame
-                self._process_single_frame(frame)
+                # Process the frames
+                self._process_frames(batch)
                 
             except Exception as e:
                 self.logger.error(f"Error in OCR processing loop: {e}")
                 time.sleep(0.1)
     
+    def _collect_batch(self) -> List[np.ndarray]:
+        """
+        Collect up to batch_size frames, waiting at most max_wait_time after the first.
+        
+        Returns:
+            List of frames (empty if nothing arrived within a second)
+        """
+        try:
+            batch = [self.processing_queue.get(timeout=1.0)]
+        except Empty:
+            return []
+        
+        with self._batch_lock:
+            self._batch_open = True
+            self._batch_joins = 0
+        
+        deadline = time.time() + self.max_wait_time
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.processing_queue.get(timeout=remaining))
+            except Empty:
+                break
+        
+        with self._batch_lock:
+            self._batch_open = False
+            joined = self._batch_joins
+        # Frames admitted just before the batch closed are already queued
+        while len(batch) < 1 + joined:
+            try:
+                batch.append(self.processing_queue.get_nowait())
+            except Empty:
+                break
+        return batch
+    
+    def _extract_best(self, frames: List[np.ndarray]):
+        """
+        Run OCR on all frames concurrently and keep the most complete read.
+        
+        Args:
+            frames: Image frames showing the same text
+            
+        Returns:
+            Tuple of (extracted_text, status_message) as from OCREngine.extract_text
+        """
+        if len(frames) == 1:
+            return self.ocr_engine.extract_text(frames[0])
+        
+        pool = self._ocr_pool
+        results = list(pool.map(self.ocr_engine.extract_text, frames) if pool
+                       else map(self.ocr_engine.extract_text, frames))
+        successful = [r for r in results if r[0]]
+        if successful:
+            return max(successful, key=lambda r: len(r[0]))
+        return results[0]
+    
     def _process_single_frame(self, frame: np.ndarray) -> None:
         """
         Process a single frame for OCR.
@@ -130,6 +223,15 @@ class OCRProcessor:
         Args:
             frame: Image frame to process
         """
+        self._process_frames([frame])
+    
+    def _process_frames(self, frames: List[np.ndarray]) -> None:
+        """
+        Process a batch of frames for OCR and speak the best result.
+        
+        Args:
+            frames: Image frames to process
+        """
         try:
             self.is_processing = True
             
@@ -144,27 +246,21 @@ class OCRProcessor:
             
             # Extract text using OCR engine
             start_time = time.time()
-            extracted_text, status_message = self.ocr_engine.extract_text(frame)
+            extracted_text, status_message = self._extract_best(frames)
             processing_time = time.time() - start_time
             
-            self.logger.info(f"OCR processing completed in {processing_time:.2f} seconds")
+            self.logger.info(f"OCR processing of {len(frames)} frame(s) completed in {processing_time:.2f} seconds")
             
             # Handle results
             if extracted_text:
                 self.logger.info(f"Text extracted: {extracted_text[:100]}...")
-                # Speak the extracted text
-                if not self.audio_manager.is_busy():
-                    self.audio_manager.speak_text(extracted_text)
-                else:
-                    # Wait a bit and try again
-                    time.sleep(0.5)
-                    if not self.audio_manager.is_busy():
-                        self.audio_manager.speak_text(extracted_text)
+                # Speak the extracted text; speech is queued, so it follows
+                # the "Processing text" cue instead of being skipped
+                self.audio_manager.speak_text(extracted_text)
             else:
                 self.logger.info(f"No text found: {status_message}")
                 # Speak the status message
-                if not self.audio_manager.is_busy():
-                    self.audio_manager.speak_text(status_message)
+                self.audio_manager.speak_text(status_message)
             
             # Notify processing complete
             if self.on_processing_complete:
@@ -173,8 +269,7 @@ class OCRProcessor:
         except Exception as e:
             self.logger.error(f"Error processing OCR frame: {e}")
             error_message = "OCR processing failed"
-            if not self.audio_manager.is_busy():
-                self.audio_manager.speak_text(error_message)
+            self.audio_manager.speak_text(error_message)
         
         finally:
             self.is_processing = False
@@ -277,19 +372,16 @@ class SimpleOCRProcessor:
             # Handle results
             if extracted_text:
                 self.logger.info(f"Text extracted: {extracted_text[:100]}...")
-                if not self.audio_manager.is_busy():
-                    self.audio_manager.speak_text(extracted_text)
+                self.audio_manager.speak_text(extracted_text)
             else:
                 self.logger.info(f"No text found: {status_message}")
-                if not self.audio_manager.is_busy():
-                    self.audio_manager.speak_text(status_message)
+                self.audio_manager.speak_text(status_message)
             
             return True
             
         except Exception as e:
             self.logger.error(f"Error in OCR processing: {e}")
-            if not self.audio_manager.is_busy():
-                self.audio_manager.speak_text("OCR processing failed")
+            self.audio_manager.speak_text("OCR processing failed")
             return False
 
 
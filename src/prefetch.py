@@ -0,0 +1,105 @@
+"""
+Startup file prefetching for VisionMate-Lite.
+
+Warms the OS page cache for model weights and test fixtures in the background
+so the first model load and fixture read don't block on cold disk I/O.
+"""
+
+import glob
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List
+
+logger = logging.getLogger(__name__)
+
+# posix_fadvise lets the kernel queue readahead for every file at once without
+# copying data into Python; elsewhere the files are read in chunks on a pool
+FADVISE_AVAILABLE = hasattr(os, 'posix_fadvise') and hasattr(os, 'POSIX_FADV_WILLNEED')
+
+_CHUNK_SIZE = 1 << 20
+
+
+def _expand(patterns: Iterable[str]) -> List[str]:
+    """Expand glob patterns into a de-duplicated list of existing files."""
+    paths = []
+    seen = set()
+    for pattern in patterns:
+        for path in glob.glob(pattern, recursive=True):
+            if path not in seen and os.path.isfile(path):
+                seen.add(path)
+                paths.append(path)
+    return paths
+
+
+def _advise(path: str) -> int:
+    """Ask the kernel to read a whole file ahead; returns its size in bytes."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        os.posix_fadvise(fd, 0, size, os.POSIX_FADV_WILLNEED)
+        return size
+    finally:
+        os.close(fd)
+
+
+def _read(path: str) -> int:
+    """Read a whole file in chunks and discard it; returns its size in bytes."""
+    size = 0
+    with open(path, 'rb', buffering=0) as f:
+        while True:
+            chunk = f.read(_CHUNK_SIZE)
+            if not chunk:
+                return size
+            size += len(chunk)
+
+
+def _safe_call(loader):
+    """Wrap a loader so one unreadable file doesn't abort the whole batch."""
+    def call(path: str) -> int:
+        try:
+            return loader(path)
+        except OSError as e:
+            logger.debug(f"Could not prefetch {path}: {e}")
+            return 0
+    return call
+
+
+def prefetch_files(patterns: Iterable[str], max_workers: int = 4) -> int:
+    """
+    Pull files matching the given glob patterns into the page cache.
+
+    Args:
+        patterns: Glob patterns (recursive '**' supported)
+        max_workers: Reader threads used when posix_fadvise is unavailable
+
+    Returns:
+        Total number of bytes prefetched
+    """
+    paths = _expand(patterns)
+    if not paths:
+        return 0
+
+    loader = _advise if FADVISE_AVAILABLE else _read
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        total = sum(executor.map(_safe_call(loader), paths))
+
+    logger.debug(f"Prefetched {len(paths)} files ({total / 1e6:.1f} MB)")
+    return total
+
+
+def start_prefetch(patterns: Iterable[str]) -> threading.Thread:
+    """
+    Prefetch files on a daemon thread so startup doesn't wait for it.
+
+    Args:
+        patterns: Glob patterns (recursive '**' supported)
+
+    Returns:
+        The started thread
+    """
+    thread = threading.Thread(target=prefetch_files, args=(list(patterns),),
+                              name="file-prefetch", daemon=True)
+    thread.start()
+    return thread
@@ -115,6 +115,26 @@ class SceneClassifier:
             logging.error(f"Failed to initialize scene classification: {e}")
             self.model = None
     
+    def warmup(self, iterations: int = 1):
+        """
+        Run dummy forward passes so the first real classification is not slowed
+        by one-time framework initialization. Does not touch scene state.
+        
+        Args:
+            iterations: Number of warm-up passes
+        """
+        if self.model is None or self.model == "dummy":
+            return
+        
+        try:
+            dummy = np.zeros((224, 224, 3), dtype=np.uint8)
+            input_tensor = self.transform(dummy).unsqueeze(0)
+            with torch.no_grad():
+                for _ in range(iterations):
+                    self.model(input_tensor)
+        except Exception as e:
+            logging.warning(f"Scene classifier warm-up failed: {e}")
+    
     def should_classify(self) -> bool:
         """
         Check if enough time has passed for next classification.
@@ -269,6 +289,9 @@ class DummySceneClassifier:
     def __init__(self, *args, **kwargs):
         pass
     
+    def warmup(self, iterations: int = 1):
+        pass
+    
     def should_classify(self) -> bool:
         return False
     
@@ -95,6 +95,11 @@ class SceneIntegration:
             self.logger.error(f"Error in scene processing: {e}")
             return None
     
+    def warmup(self, iterations: int = 1):
+        """Warm up the scene classifier without affecting scene state or announcements."""
+        if self.enabled:
+            self.scene_classifier.warmup(iterations)
+    
     def is_enabled(self) -> bool:
         """Check if scene classification is enabled and available."""
         return self.enabled and self.scene_classifier.is_enabled()
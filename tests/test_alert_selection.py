@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Test script for the proximity alert selection paths.
+
+select_alerts runs a numba scan when numba is installed and a NumPy one
+otherwise; both must agree with the per-detection Detection.is_close logic.
+"""
+
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+FRAME_W, FRAME_H = 100, 100
+RATIO = 0.15
+COOLDOWN = 5.0
+NOW = 100.0
+
+
+def _make_detections(boxes, class_ids):
+    """Build a DetectionList from (x1, y1, x2, y2) boxes and class IDs."""
+    from src.detection import Detection, DetectionList
+
+    return DetectionList(Detection(f"class_{class_id}", 0.9, box, class_id)
+                         for box, class_id in zip(boxes, class_ids))
+
+
+def _expected_alerts(detections, last_alert):
+    """Reference alert decisions computed one Detection at a time."""
+    return [d.is_close(FRAME_W, FRAME_H, RATIO) and NOW - last_alert[d.class_id] > COOLDOWN
+            for d in detections]
+
+
+def _run_paths(detections, last_alert):
+    """Return {path name: mask list} for every alert implementation available."""
+    import numpy as np
+    import src.detection as detection
+
+    args = (detections.boxes, detections.class_ids, float(FRAME_W), float(FRAME_H),
+            last_alert, NOW, COOLDOWN, RATIO)
+    masks = {"numpy": detection._select_alerts_numpy(*args)}
+    if detection.NUMBA_AVAILABLE:
+        masks["numba"] = detection._select_alerts_numba(*args)
+    masks["select_alerts"] = detection.select_alerts(detections, FRAME_W, FRAME_H, last_alert,
+                                                     NOW, COOLDOWN, RATIO)
+    return {name: np.asarray(mask, dtype=bool).tolist() for name, mask in masks.items()}
+
+
+def _check_paths(detections, last_alert):
+    """Assert that every path matches the reference decisions."""
+    expected = _expected_alerts(detections, last_alert)
+    for name, mask in _run_paths(detections, last_alert).items():
+        assert mask == expected, f"{name} returned {mask}, expected {expected}"
+    return expected
+
+
+def test_empty_detections():
+    """Test that every path returns an empty mask for an empty list."""
+    print("=" * 60)
+    print("Testing empty detections")
+    print("=" * 60)
+
+    try:
+        import numpy as np
+        from src.detection import NUMBA_AVAILABLE
+
+        last_alert = np.full(4, -np.inf, dtype=np.float64)
+        _check_paths(_make_detections([], []), last_alert)
+
+        print(f"✅ Empty list gives an empty mask (numba: {NUMBA_AVAILABLE})")
+        return True
+    except Exception as e:
+        print(f"❌ Empty detections test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_proximity_threshold():
+    """Test boxes just below, exactly at and just above the proximity threshold."""
+    print("\n" + "=" * 60)
+    print("Testing proximity threshold")
+    print("=" * 60)
+
+    try:
+        import numpy as np
+
+        # 1500 px of a 10000 px frame is exactly RATIO, which is not close
+        boxes = [(0, 0, 50, 29), (0, 0, 50, 30), (0, 0, 50, 31), (10, 10, 60, 40)]
+        detections = _make_detections(boxes, [0, 1, 2, 3])
+        last_alert = np.full(4, -np.inf, dtype=np.float64)
+
+        expected = _check_paths(detections, last_alert)
+        assert expected == [False, False, True, False], f"unexpected reference {expected}"
+
+        print("✅ All paths agree at the proximity threshold")
+        return True
+    except Exception as e:
+        print(f"❌ Proximity threshold test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_alert_cooldown():
+    """Test classes inside, exactly at and outside the alert cooldown."""
+    print("\n" + "=" * 60)
+    print("Testing alert cooldown")
+    print("=" * 60)
+
+    try:
+        import numpy as np
+
+        # Every box is close, so only the cooldown decides
+        detections = _make_detections([(0, 0, 80, 80)] * 5, [0, 1, 2, 3, 1])
+        last_alert = np.array([-np.inf, NOW - 1.0, NOW - COOLDOWN, NOW - 10.0], dtype=np.float64)
+
+        expected = _check_paths(detections, last_alert)
+        assert expected == [True, False, False, True, False], f"unexpected reference {expected}"
+
+        print("✅ All paths agree on the cooldown")
+        return True
+    except Exception as e:
+        print(f"❌ Alert cooldown test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_close_mask():
+    """Test that DetectionList.close_mask matches Detection.is_close."""
+    print("\n" + "=" * 60)
+    print("Testing DetectionList.close_mask")
+    print("=" * 60)
+
+    try:
+        boxes = [(0, 0, 50, 29), (0, 0, 50, 30), (0, 0, 50, 31), (5, 5, 95, 95), (0, 0, 0, 0)]
+        detections = _make_detections(boxes, [0, 1, 2, 3, 0])
+
+        for threshold in (RATIO, 0.3, 0.81):
+            expected = [d.is_close(FRAME_W, FRAME_H, threshold) for d in detections]
+            mask = detections.close_mask(FRAME_W, FRAME_H, threshold).tolist()
+            assert mask == expected, f"threshold {threshold}: got {mask}, expected {expected}"
+
+        print("✅ close_mask matches is_close")
+        return True
+    except Exception as e:
+        print(f"❌ close_mask test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Run all alert selection tests."""
+    results = {
+        "Empty Detections": test_empty_detections(),
+        "Proximity Threshold": test_proximity_threshold(),
+        "Alert Cooldown": test_alert_cooldown(),
+        "Close Mask": test_close_mask()
+    }
+
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+
+    for test_name, result in results.items():
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{test_name}: {status}")
+
+    all_passed = all(results.values())
+    return 0 if all_passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
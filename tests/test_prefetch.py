@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test script for the startup file prefetcher.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def _make_files(root, sizes):
+    """Create files of the given sizes under root and return their paths."""
+    paths = []
+    for i, size in enumerate(sizes):
+        path = os.path.join(root, f"file_{i}.pt")
+        with open(path, 'wb') as f:
+            f.write(b'\0' * size)
+        paths.append(path)
+    return paths
+
+
+def test_prefetch_counts_bytes():
+    """Test that prefetch_files reports the total size of matched files."""
+    print("=" * 60)
+    print("Testing prefetch_files")
+    print("=" * 60)
+
+    try:
+        from src.prefetch import prefetch_files, FADVISE_AVAILABLE
+
+        with tempfile.TemporaryDirectory() as root:
+            _make_files(root, [1024, 4096, 0])
+            pattern = os.path.join(root, '*.pt')
+
+            # Duplicate patterns must not prefetch a file twice
+            total = prefetch_files([pattern, pattern])
+            assert total == 5120, f"expected 5120 bytes, got {total}"
+            print(f"✅ Prefetched 5120 bytes (fadvise: {FADVISE_AVAILABLE})")
+
+            assert prefetch_files([os.path.join(root, 'missing', '*.png')]) == 0
+            print("✅ Unmatched patterns are ignored")
+
+        return True
+    except Exception as e:
+        print(f"❌ prefetch_files test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_prefetch_read_fallback():
+    """Test the chunked-read path used where posix_fadvise is unavailable."""
+    print("\n" + "=" * 60)
+    print("Testing read fallback")
+    print("=" * 60)
+
+    try:
+        import src.prefetch as prefetch
+
+        original = prefetch.FADVISE_AVAILABLE
+        prefetch.FADVISE_AVAILABLE = False
+        try:
+            with tempfile.TemporaryDirectory() as root:
+                _make_files(root, [3 * (1 << 20) + 7])
+                total = prefetch.prefetch_files([os.path.join(root, '*.pt')])
+                assert total == 3 * (1 << 20) + 7, f"unexpected size {total}"
+        finally:
+            prefetch.FADVISE_AVAILABLE = original
+
+        print("✅ Chunked read fallback reads whole files")
+        return True
+    except Exception as e:
+        print(f"❌ Read fallback test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_start_prefetch():
+    """Test that start_prefetch runs in the background and finishes."""
+    print("\n" + "=" * 60)
+    print("Testing start_prefetch")
+    print("=" * 60)
+
+    try:
+        from src.prefetch import start_prefetch
+
+        with tempfile.TemporaryDirectory() as root:
+            _make_files(root, [2048])
+            thread = start_prefetch([os.path.join(root, '*.pt')])
+            assert thread.daemon, "prefetch thread must not block interpreter exit"
+            thread.join(timeout=5.0)
+            assert not thread.is_alive(), "prefetch thread did not finish"
+
+        print("✅ Background prefetch completed")
+        return True
+    except Exception as e:
+        print(f"❌ start_prefetch test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """Run all prefetch tests."""
+    results = {
+        "Prefetch Byte Count": test_prefetch_counts_bytes(),
+        "Read Fallback": test_prefetch_read_fallback(),
+        "Background Prefetch": test_start_prefetch()
+    }
+
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+
+    for test_name, result in results.items():
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{test_name}: {status}")
+
+    all_passed = all(results.values())
+    return 0 if all_passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())